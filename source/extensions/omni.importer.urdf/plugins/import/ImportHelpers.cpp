@@ -21,6 +21,9 @@
 
 #include <boost/algorithm/string.hpp>
 
+#include <unordered_map>
+#include <vector>
+
 namespace omni
 {
 namespace importer
@@ -108,13 +111,16 @@ void urdfToInertia(const UrdfInertia& urdfInertia, Matrix33& inertia)
     inertia.cols[2].z = urdfInertia.izz;
 }
 
-void mergeFixedChildLinks(const KinematicChain::Node& parentNode, UrdfRobot& robot)
+// Names of the joints attached to each link, keyed by the joint's parent link name
+using ChildJointMap = std::unordered_map<std::string, std::vector<std::string>>;
+
+static void mergeFixedChildLinks(const KinematicChain::Node& parentNode, UrdfRobot& robot, ChildJointMap& childJoints)
 {
     // Child contribution to inertia
     for (auto& childNode : parentNode.childNodes_)
     {
         // Depth first
-        mergeFixedChildLinks(*childNode, robot);
+        mergeFixedChildLinks(*childNode, robot, childJoints);
 
         if (robot.joints.at(childNode->parentJointName_).type == UrdfJointType::FIXED &&
             !robot.joints.at(childNode->parentJointName_).dontCollapse)
@@ -183,12 +189,24 @@ void mergeFixedChildLinks(const KinematicChain::Node& parentNode, UrdfRobot& rob
                 urdfParentLink.visuals.push_back(visual);
             }
             urdfChildLink.visuals.clear();
-            for (auto& joint : robot.joints)
+            // Re-parent the joints attached to the child, looking them up in the index instead of scanning all joints
+            auto children = childJoints.find(childNode->linkName_);
+            if (children != childJoints.end())
             {
-                if (joint.second.parentLinkName == childNode->linkName_)
+                std::vector<std::string> childJointNames = std::move(children->second);
+                childJoints.erase(children);
+                auto& parentJointNames = childJoints[parentNode.linkName_];
+                for (const auto& jointName : childJointNames)
                 {
-                    joint.second.parentLinkName = parentNode.linkName_;
-                    joint.second.origin = poseChildToParent * joint.second.origin;
+                    auto joint = robot.joints.find(jointName);
+                    // Joints of links merged earlier have already been removed
+                    if (joint == robot.joints.end())
+                    {
+                        continue;
+                    }
+                    joint->second.parentLinkName = parentNode.linkName_;
+                    joint->second.origin = poseChildToParent * joint->second.origin;
+                    parentJointNames.push_back(jointName);
                 }
             }
 
@@ -202,6 +220,16 @@ void mergeFixedChildLinks(const KinematicChain::Node& parentNode, UrdfRobot& rob
     }
 }
 
+void mergeFixedChildLinks(const KinematicChain::Node& parentNode, UrdfRobot& robot)
+{
+    ChildJointMap childJoints;
+    for (const auto& joint : robot.joints)
+    {
+        childJoints[joint.second.parentLinkName].push_back(joint.first);
+    }
+    mergeFixedChildLinks(parentNode, robot, childJoints);
+}
+
 bool collapseFixedJoints(UrdfRobot& robot)
 {
     KinematicChain chain;
@@ -138,7 +138,8 @@ class URDFImportRobot(omni.kit.commands.Command):
             self._dest_path = self._dest_path.replace(
                 "\\", "/"
             )  # Omni client works with both slashes cross platform, making it standard to make it easier later on
-            result = omni.client.read_file(self._dest_path)
+            # Only existence matters here, so stat the destination instead of reading it back
+            result = omni.client.stat(self._dest_path)
             if result[0] != Result.OK:
                 stage = Usd.Stage.CreateNew(self._dest_path)
                 stage.Save()
@@ -195,7 +196,8 @@ class URDFParseAndImportFile(omni.kit.commands.Command):
             self.dest_path = self.dest_path.replace(
                 "\\", "/"
             )  # Omni client works with both slashes cross platform, making it standard to make it easier later on
-            result = omni.client.read_file(self.dest_path)
+            # Only existence matters here, so stat the destination instead of reading it back
+            result = omni.client.stat(self.dest_path)
             if result[0] != Result.OK:
                 stage = Usd.Stage.CreateNew(self.dest_path)
                 stage.Save()
@@ -28,6 +28,11 @@ COLOR_Y = 0xFF76A371
 COLOR_Z = 0xFFA07D4F
 COLOR_W = 0xFFAA5555
 
+# Shared button state styles, referenced by every button family in both themes
+_STATE_HOVER = {"background_color": 0xFF333333}
+_STATE_PRESSED = {"background_color": 0xFF222222}
+_STATE_TRANSPARENT = {"background_color": 0x0}
+
 
 def get_style():
 
@@ -154,7 +159,7 @@ def get_style():
                 "selected_color": 0xFFACACAF,
                 "border_radius": LIGHT_BORDER_RADIUS * 2,
             },
-            "ComboBox::xform_op:hovered": {"background_color": 0x0},
+            "ComboBox::xform_op:hovered": _STATE_TRANSPARENT,
             "ComboBox::xform_op:selected": {"background_color": 0xFF545454},
             "ComboBox": {
                 "font_size": 10,
@@ -306,8 +311,8 @@ def get_style():
                 "color": 0xFFC2C2C2,
                 "background_color": 0xFFC2C2C2,
             },  # FIELD_BACKGROUND},
-            "Rectangle::xform_op:hovered": {"background_color": 0x0},
-            "Rectangle::xform_op": {"background_color": 0x0},
+            "Rectangle::xform_op:hovered": _STATE_TRANSPARENT,
+            "Rectangle::xform_op": _STATE_TRANSPARENT,
             # text remove
             "Button::remove": {"background_color": FIELD_BACKGROUND, "margin": 0},
             "Button::remove:hovered": {"background_color": FIELD_BACKGROUND},
@@ -315,9 +320,9 @@ def get_style():
             "Button.Image::options": {"image_url": f"{icons_path}/options.svg", "color": 0xFF989898},
             "Button.Image::options:hovered": {"color": 0xFFC2C2C2},
             "IconButton": {"margin": 0, "padding": 0, "background_color": 0x0},
-            "IconButton:hovered": {"background_color": 0x0},
-            "IconButton:checked": {"background_color": 0x0},
-            "IconButton:pressed": {"background_color": 0x0},
+            "IconButton:hovered": _STATE_TRANSPARENT,
+            "IconButton:checked": _STATE_TRANSPARENT,
+            "IconButton:pressed": _STATE_TRANSPARENT,
             "IconButton.Image": {"color": 0xFFA8A8A8},
             "IconButton.Image:hovered": {"color": 0xFF929292},
             "IconButton.Image:pressed": {"color": 0xFFA4A4A4},
@@ -375,8 +380,8 @@ def get_style():
             "ItemButton": {"padding": 2, "background_color": 0xFF444444, "border_radius": 4},
             "ItemButton.Image::add": {"image_url": f"{icons_path}/plus.svg", "color": 0xFF06C66B},
             "ItemButton.Image::remove": {"image_url": f"{icons_path}/trash.svg", "color": 0xFF1010C6},
-            "ItemButton:hovered": {"background_color": 0xFF333333},
-            "ItemButton:pressed": {"background_color": 0xFF222222},
+            "ItemButton:hovered": _STATE_HOVER,
+            "ItemButton:pressed": _STATE_PRESSED,
             "Tooltip": TOOLTIP_STYLE,
         }
     else:
@@ -604,9 +609,9 @@ def get_style():
             "Button.Image::options": {"image_url": f"{icons_path}/options.svg", "color": 0xFF989898},
             "Button.Image::options:hovered": {"color": 0xFFC2C2C2},
             "IconButton": {"margin": 0, "padding": 0, "background_color": 0x0},
-            "IconButton:hovered": {"background_color": 0x0},
-            "IconButton:checked": {"background_color": 0x0},
-            "IconButton:pressed": {"background_color": 0x0},
+            "IconButton:hovered": _STATE_TRANSPARENT,
+            "IconButton:checked": _STATE_TRANSPARENT,
+            "IconButton:pressed": _STATE_TRANSPARENT,
             "IconButton.Image": {"color": 0xFFA8A8A8},
             "IconButton.Image:hovered": {"color": 0xFFC2C2C2},
             "IconButton.Image:pressed": {"color": 0xFFA4A4A4},
@@ -664,8 +669,8 @@ def get_style():
             "ItemButton": {"padding": 2, "background_color": 0xFF444444, "border_radius": 4},
             "ItemButton.Image::add": {"image_url": f"{icons_path}/plus.svg", "color": 0xFF06C66B},
             "ItemButton.Image::remove": {"image_url": f"{icons_path}/trash.svg", "color": 0xFF1010C6},
-            "ItemButton:hovered": {"background_color": 0xFF333333},
-            "ItemButton:pressed": {"background_color": 0xFF222222},
+            "ItemButton:hovered": _STATE_HOVER,
+            "ItemButton:pressed": _STATE_PRESSED,
             "Tooltip": TOOLTIP_STYLE,
         }
 
@@ -14,23 +14,30 @@
 # limitations under the License.
 
 import asyncio
+import builtins
+import functools
+import itertools
 import os
 import subprocess
 import sys
-from cmath import inf
+import webbrowser
 
 import carb
-import carb.settings
-import omni.appwindow
-import omni.ext
+import omni.kit.app
 import omni.ui as ui
 from omni.kit.window.extensions import SimpleCheckBox
+from omni.kit.window.extensions.ext_components import SearchWidget
 from omni.kit.window.filepicker import FilePickerDialog
 from omni.kit.window.property.templates import LABEL_HEIGHT, LABEL_WIDTH
 
 # from .callbacks import on_copy_to_clipboard, on_docs_link_clicked, on_open_folder_clicked, on_open_IDE_clicked
 from .style import BUTTON_WIDTH, COLOR_W, COLOR_X, COLOR_Y, COLOR_Z, get_style
 
+try:
+    import pyperclip
+except ImportError:
+    pyperclip = None
+
 # Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
 #
 # NVIDIA CORPORATION and its licensors retain all intellectual property
@@ -40,14 +47,107 @@ from .style import BUTTON_WIDTH, COLOR_W, COLOR_X, COLOR_Y, COLOR_Z, get_style
 # license agreement from NVIDIA CORPORATION is strictly prohibited.
 #
 
+# Style is resolved once at import; builders reference these instead of rebuilding the dict per widget
+_STYLE = get_style()
+_COPY_ICON_STYLE = _STYLE["IconButton.Image::CopyToClipboard"]
+_FOLDER_PICKER_ICON_STYLE = _STYLE["IconButton.Image::FolderPicker"]
+_OPEN_CONFIG_ICON_STYLE = _STYLE["IconButton.Image::OpenConfig"]
+_OPEN_FOLDER_ICON_STYLE = _STYLE["IconButton.Image::OpenFolder"]
+_OPEN_LINK_ICON_STYLE = _STYLE["IconButton.Image::OpenLink"]
+# Plot colors are only defined by the dark theme
+_PLOT_X_STYLE = _STYLE.get("PlotLabel::X", {})
+_PLOT_Y_STYLE = _STYLE.get("PlotLabel::Y", {})
+_PLOT_Z_STYLE = _STYLE.get("PlotLabel::Z", {})
+_PLOT_XYZ_STYLES = (_PLOT_X_STYLE, _PLOT_Y_STYLE, _PLOT_Z_STYLE)
+
+# Enum values bound once; the builders below use these on every widget
+_ALIGN_LC = ui.Alignment.LEFT_CENTER
+_ALIGN_LT = ui.Alignment.LEFT_TOP
+_ALIGN_LB = ui.Alignment.LEFT_BOTTOM
+_ALIGN_RT = ui.Alignment.RIGHT_TOP
+_ALIGN_CENTER = ui.Alignment.CENTER
+_SBAR_AS_NEEDED = ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED
+_SBAR_ALWAYS_ON = ui.ScrollBarPolicy.SCROLLBAR_ALWAYS_ON
+_SBAR_ALWAYS_OFF = ui.ScrollBarPolicy.SCROLLBAR_ALWAYS_OFF
+_LABEL_WIDTH_NARROW = LABEL_WIDTH - 12
+
+# Axis labels/colors and tooltips shared by the XYZ builders
+_FIELD_LABELS = (("X", COLOR_X), ("Y", COLOR_Y), ("Z", COLOR_Z), ("W", COLOR_W))
+_FIELD_TOOLTIPS = ("X Value", "Y Value", "Z Value", "W Value")
+
+
+def _noop(_):
+    pass
+
+
+def _label(text, tt, width=LABEL_WIDTH, align=_ALIGN_LC):
+    """Left-hand row label shared by all builders."""
+    return ui.Label(text, width=width, alignment=align, tooltip=tt)
+
+
+# Throttlers with a pending value, flushed together on the next app update
+_dirty_throttlers = set()
+_throttle_sub = None
+# Updates without any pending value before the shared subscription is dropped
+_THROTTLE_IDLE_UPDATES = 60
+_throttle_idle = 0
+
+
+def _flush_throttlers(e):
+    global _throttle_sub, _throttle_idle
+    if not _dirty_throttlers:
+        _throttle_idle += 1
+        if _throttle_idle >= _THROTTLE_IDLE_UPDATES:
+            _throttle_sub = None
+        return
+    _throttle_idle = 0
+    dirty = tuple(_dirty_throttlers)
+    _dirty_throttlers.clear()
+    for throttler in dirty:
+        throttler.flush()
+
+
+class _Throttler:
+    """Coalesces value-changed events so that the callback runs at most once per app update.
+
+    Dragging a field fires many value-changed events per frame; only the latest model state is
+    dispatched, so the callback runs on the next update tick rather than inside the value change.
+    All throttlers share one update subscription. It stays alive while values keep changing and is
+    only dropped after a quiet period without any pending value.
+    """
+
+    def __init__(self, callback):
+        self._callback = callback
+        self._model = None
+
+    def attach(self, model):
+        model.add_value_changed_fn(self.notify)
+        return model
+
+    def notify(self, model):
+        global _throttle_sub, _throttle_idle
+        self._model = model
+        _dirty_throttlers.add(self)
+        _throttle_idle = 0
+        if _throttle_sub is None:
+            _throttle_sub = (
+                omni.kit.app.get_app()
+                .get_update_event_stream()
+                .create_subscription_to_pop(_flush_throttlers, name="ui_utils throttled value changed")
+            )
+
+    def flush(self):
+        model = self._model
+        self._model = None
+        if model is not None:
+            self._callback(model)
+
 
 def on_copy_to_clipboard(to_copy: str) -> None:
     """
     Copy text to system clipboard
     """
-    try:
-        import pyperclip
-    except ImportError:
+    if pyperclip is None:
         carb.log_warn("Could not import pyperclip.")
         return
     try:
@@ -68,9 +168,7 @@ def on_open_IDE_clicked(ext_path: str, file_path: str) -> None:
             )
     else:
         try:
-            cmd_string = "code " + ext_path + " " + file_path
-            subprocess.run([cmd_string], shell=True, check=True)
-            # os.system("code " + ext_path + " " + file_path)
+            subprocess.Popen(["code", ext_path, file_path])
         except Exception:
             carb.log_warn(
                 "Could not open in VSCode. See Troubleshooting help here: https://code.visualstudio.com/docs/editor/command-line#_common-questions"
@@ -79,22 +177,21 @@ def on_open_IDE_clicked(ext_path: str, file_path: str) -> None:
 
 def on_open_folder_clicked(file_path: str) -> None:
     """Opens the current directory in a File Browser"""
+    folder = os.path.dirname(os.path.abspath(file_path))
     if sys.platform == "win32":
         try:
-            subprocess.Popen(["start", os.path.abspath(os.path.dirname(file_path))], shell=True)
+            subprocess.Popen(["explorer", folder])
         except OSError:
             carb.log_warn("Could not open file browser.")
     else:
         try:
-            subprocess.run(["xdg-open", os.path.abspath(file_path.rpartition("/")[0])], check=True)
+            subprocess.Popen(["xdg-open", folder])
         except Exception:
             carb.log_warn("could not open file browser")
 
 
 def on_docs_link_clicked(doc_link: str) -> None:
     """Opens an extension's documentation in a Web Browser"""
-    import webbrowser
-
     try:
         webbrowser.open(doc_link, new=2)
     except Exception as e:
@@ -114,15 +211,16 @@ def btn_builder(label="", type="button", text="button", tooltip="", on_clicked_f
     Returns:
         ui.Button: Button
     """
+    tt = format_tt(tooltip)
     with ui.HStack():
-        ui.Label(label, width=LABEL_WIDTH, alignment=ui.Alignment.LEFT_CENTER, tooltip=format_tt(tooltip))
+        _label(label, tt)
         btn = ui.Button(
             text.upper(),
             name="Button",
             width=BUTTON_WIDTH,
             clicked_fn=on_clicked_fn,
-            style=get_style(),
-            alignment=ui.Alignment.LEFT_CENTER,
+            style=_STYLE,
+            alignment=_ALIGN_LC,
         )
         ui.Spacer(width=5)
         add_line_rect_flourish(True)
@@ -149,24 +247,27 @@ def state_btn_builder(
         tooltip (str, optional): Tooltip to display over the Label. Defaults to "".
         on_clicked_fn (Callable, optional): Call-back function when clicked. Defaults to None.
     """
+    a_text = a_text.upper()
+    b_text = b_text.upper()
 
     def toggle():
-        if btn.text == a_text.upper():
-            btn.text = b_text.upper()
+        if btn.text == a_text:
+            btn.text = b_text
             on_clicked_fn(True)
         else:
-            btn.text = a_text.upper()
+            btn.text = a_text
             on_clicked_fn(False)
 
+    tt = format_tt(tooltip)
     with ui.HStack():
-        ui.Label(label, width=LABEL_WIDTH, alignment=ui.Alignment.LEFT_CENTER, tooltip=format_tt(tooltip))
+        _label(label, tt)
         btn = ui.Button(
-            a_text.upper(),
+            a_text,
             name="Button",
             width=BUTTON_WIDTH,
             clicked_fn=toggle,
-            style=get_style(),
-            alignment=ui.Alignment.LEFT_CENTER,
+            style=_STYLE,
+            alignment=_ALIGN_LC,
         )
         ui.Spacer(width=5)
         # add_line_rect_flourish(False)
@@ -175,7 +276,7 @@ def state_btn_builder(
         with ui.Frame(width=0):
             with ui.VStack():
                 with ui.Placer(offset_x=0, offset_y=7):
-                    ui.Rectangle(height=5, width=5, alignment=ui.Alignment.CENTER)
+                    ui.Rectangle(height=5, width=5, alignment=_ALIGN_CENTER)
         ui.Spacer(width=5)
     return btn
 
@@ -194,20 +295,18 @@ def cb_builder(label="", type="checkbox", default_val=False, tooltip="", on_clic
         ui.SimpleBoolModel: model
     """
 
+    tt = format_tt(tooltip)
     with ui.HStack():
-        ui.Label(label, width=LABEL_WIDTH - 12, alignment=ui.Alignment.LEFT_CENTER, tooltip=format_tt(tooltip))
+        _label(label, tt, _LABEL_WIDTH_NARROW)
         model = ui.SimpleBoolModel()
-        callable = on_clicked_fn
-        if callable is None:
-            callable = lambda x: None
-        SimpleCheckBox(default_val, callable, model=model)
+        SimpleCheckBox(default_val, on_clicked_fn or _noop, model=model)
 
         add_line_rect_flourish()
         return model
 
 
 def multi_btn_builder(
-    label="", type="multi_button", count=2, text=["button", "button"], tooltip=["", "", ""], on_clicked_fn=[None, None]
+    label="", type="multi_button", count=2, text=("button", "button"), tooltip=("", "", ""), on_clicked_fn=None
 ):
     """Creates a Row of Stylized Buttons
 
@@ -215,25 +314,28 @@ def multi_btn_builder(
         label (str, optional): Label to the left of the UI element. Defaults to "".
         type (str, optional): Type of UI element. Defaults to "multi_button".
         count (int, optional): Number of UI elements to create. Defaults to 2.
-        text (list, optional): List of text rendered on the UI elements. Defaults to ["button", "button"].
-        tooltip (list, optional): List of tooltips to display over the UI elements. Defaults to ["", "", ""].
-        on_clicked_fn (list, optional): List of call-backs function when clicked. Defaults to [None, None].
+        text (list, optional): List of text rendered on the UI elements. Defaults to ("button", "button").
+        tooltip (list, optional): List of tooltips to display over the UI elements. Defaults to ("", "", "").
+        on_clicked_fn (list, optional): List of call-backs function when clicked. Defaults to None.
 
     Returns:
         list(ui.Button): List of Buttons
     """
+    on_clicked_fn = on_clicked_fn or (None,) * count
+    text = tuple(t.upper() for t in text[:count])
     btns = []
+    tts = [format_tt(t) for t in tooltip]
     with ui.HStack():
-        ui.Label(label, width=LABEL_WIDTH, alignment=ui.Alignment.LEFT_CENTER, tooltip=format_tt(tooltip[0]))
+        _label(label, tts[0])
         for i in range(count):
             btn = ui.Button(
-                text[i].upper(),
+                text[i],
                 name="Button",
                 width=BUTTON_WIDTH,
                 clicked_fn=on_clicked_fn[i],
-                tooltip=format_tt(tooltip[i + 1]),
-                style=get_style(),
-                alignment=ui.Alignment.LEFT_CENTER,
+                tooltip=tts[i + 1],
+                style=_STYLE,
+                alignment=_ALIGN_LC,
             )
             btns.append(btn)
             if i < count:
@@ -246,10 +348,10 @@ def multi_cb_builder(
     label="",
     type="multi_checkbox",
     count=2,
-    text=[" ", " "],
-    default_val=[False, False],
-    tooltip=["", "", ""],
-    on_clicked_fn=[None, None],
+    text=(" ", " "),
+    default_val=(False, False),
+    tooltip=("", "", ""),
+    on_clicked_fn=None,
 ):
     """Creates a Row of Stylized Checkboxes.
 
@@ -257,26 +359,23 @@ def multi_cb_builder(
         label (str, optional): Label to the left of the UI element. Defaults to "".
         type (str, optional): Type of UI element. Defaults to "multi_checkbox".
         count (int, optional): Number of UI elements to create. Defaults to 2.
-        text (list, optional): List of text rendered on the UI elements. Defaults to [" ", " "].
-        default_val (list, optional): List of default values. Checked is True, Unchecked is False. Defaults to [False, False].
-        tooltip (list, optional): List of tooltips to display over the UI elements. Defaults to ["", "", ""].
-        on_clicked_fn (list, optional): List of call-backs function when clicked. Defaults to [None, None].
+        text (list, optional): List of text rendered on the UI elements. Defaults to (" ", " ").
+        default_val (list, optional): List of default values. Checked is True, Unchecked is False. Defaults to (False, False).
+        tooltip (list, optional): List of tooltips to display over the UI elements. Defaults to ("", "", "").
+        on_clicked_fn (list, optional): List of call-backs function when clicked. Defaults to None.
 
     Returns:
         list(ui.SimpleBoolModel): List of models
     """
+    on_clicked_fn = on_clicked_fn or (None,) * count
     cbs = []
+    tts = [format_tt(t) for t in tooltip]
     with ui.HStack():
-        ui.Label(label, width=LABEL_WIDTH - 12, alignment=ui.Alignment.LEFT_CENTER, tooltip=format_tt(tooltip[0]))
+        _label(label, tts[0], _LABEL_WIDTH_NARROW)
         for i in range(count):
             cb = ui.SimpleBoolModel(default_value=default_val[i])
-            callable = on_clicked_fn[i]
-            if callable is None:
-                callable = lambda x: None
-            SimpleCheckBox(default_val[i], callable, model=cb)
-            ui.Label(
-                text[i], width=BUTTON_WIDTH / 2, alignment=ui.Alignment.LEFT_CENTER, tooltip=format_tt(tooltip[i + 1])
-            )
+            SimpleCheckBox(default_val[i], on_clicked_fn[i] or _noop, model=cb)
+            ui.Label(text[i], width=BUTTON_WIDTH / 2, alignment=_ALIGN_LC, tooltip=tts[i + 1])
             if i < count - 1:
                 ui.Spacer(width=5)
             cbs.append(cb)
@@ -297,7 +396,7 @@ def str_builder(
     bookmark_path=None,
     folder_dialog_title="Select Output Folder",
     folder_button_title="Select Folder",
-    style=get_style(),
+    style=None,
 ):
     """Creates a Stylized Stringfield Widget
 
@@ -311,17 +410,20 @@ def str_builder(
         item_filter_fn (Callable, optional): filter function to pass to the FilePicker
         bookmark_label (str, optional): bookmark label to pass to the FilePicker
         bookmark_path (str, optional): bookmark path to pass to the FilePicker
+        style (dict, optional): Style applied to the Stringfield. Defaults to the module style.
     Returns:
         AbstractValueModel: model of Stringfield
     """
+    style = style or _STYLE
+    tt = format_tt(tooltip)
     with ui.HStack():
-        ui.Label(label, width=LABEL_WIDTH, alignment=ui.Alignment.LEFT_CENTER, tooltip=format_tt(tooltip))
+        _label(label, tt)
         str_field = ui.StringField(
             name="StringField",
             style=style,
             width=ui.Fraction(1),
             height=0,
-            alignment=ui.Alignment.LEFT_CENTER,
+            alignment=_ALIGN_LC,
             read_only=read_only,
         ).model
         str_field.set_value(default_val)
@@ -366,17 +468,18 @@ def int_builder(label="", type="intfield", default_val=0, tooltip="", min=sys.ma
     Returns:
         AbstractValueModel: model
     """
+    tt = format_tt(tooltip)
     with ui.HStack():
-        ui.Label(label, width=LABEL_WIDTH, alignment=ui.Alignment.LEFT_CENTER, tooltip=format_tt(tooltip))
-        int_field = ui.IntDrag(
-            name="Field", height=LABEL_HEIGHT, min=min, max=max, alignment=ui.Alignment.LEFT_CENTER
-        ).model
+        _label(label, tt)
+        int_field = ui.IntDrag(name="Field", height=LABEL_HEIGHT, min=min, max=max, alignment=_ALIGN_LC).model
         int_field.set_value(default_val)
         add_line_rect_flourish(False)
     return int_field
 
 
-def float_builder(label="", type="floatfield", default_val=0, tooltip="", min=-inf, max=inf, step=0.1, format="%.2f"):
+def float_builder(
+    label="", type="floatfield", default_val=0, tooltip="", min=float("-inf"), max=float("inf"), step=0.1, format="%.2f"
+):
     """Creates a Stylized Floatfield Widget
 
     Args:
@@ -388,13 +491,14 @@ def float_builder(label="", type="floatfield", default_val=0, tooltip="", min=-i
     Returns:
         AbstractValueModel: model
     """
+    tt = format_tt(tooltip)
     with ui.HStack():
-        ui.Label(label, width=LABEL_WIDTH, alignment=ui.Alignment.LEFT_CENTER, tooltip=format_tt(tooltip))
+        _label(label, tt)
         float_field = ui.FloatDrag(
             name="FloatField",
             width=ui.Fraction(1),
             height=0,
-            alignment=ui.Alignment.LEFT_CENTER,
+            alignment=_ALIGN_LC,
             min=min,
             max=max,
             step=step,
@@ -408,7 +512,7 @@ def float_builder(label="", type="floatfield", default_val=0, tooltip="", min=-i
 def combo_cb_str_builder(
     label="",
     type="checkbox_stringfield",
-    default_val=[False, " "],
+    default_val=(False, " "),
     tooltip="",
     on_clicked_fn=lambda x: None,
     use_folder_picker=False,
@@ -421,7 +525,7 @@ def combo_cb_str_builder(
     Args:
         label (str, optional): Label to the left of the UI element. Defaults to "".
         type (str, optional): Type of UI element. Defaults to "checkbox_stringfield".
-        default_val (str, optional): Text to initialize in Stringfield. Defaults to [False, " "].
+        default_val (str, optional): Text to initialize in Stringfield. Defaults to (False, " ").
         tooltip (str, optional): Tooltip to display over the UI elements. Defaults to "".
         use_folder_picker (bool, optional): Add a folder picker button to the right. Defaults to False.
         read_only (bool, optional): Prevents editing. Defaults to False.
@@ -429,12 +533,13 @@ def combo_cb_str_builder(
     Returns:
         Tuple(ui.SimpleBoolModel, AbstractValueModel): (cb_model, str_field_model)
     """
+    tt = format_tt(tooltip)
     with ui.HStack():
-        ui.Label(label, width=LABEL_WIDTH - 12, alignment=ui.Alignment.LEFT_CENTER, tooltip=format_tt(tooltip))
+        _label(label, tt, _LABEL_WIDTH_NARROW)
         cb = ui.SimpleBoolModel(default_value=default_val[0])
         SimpleCheckBox(default_val[0], on_clicked_fn, model=cb)
         str_field = ui.StringField(
-            name="StringField", width=ui.Fraction(1), height=0, alignment=ui.Alignment.LEFT_CENTER, read_only=read_only
+            name="StringField", width=ui.Fraction(1), height=0, alignment=_ALIGN_LC, read_only=read_only
         ).model
         str_field.set_value(default_val[1])
 
@@ -450,7 +555,7 @@ def combo_cb_str_builder(
 
 
 def dropdown_builder(
-    label="", type="dropdown", default_val=0, items=["Option 1", "Option 2", "Option 3"], tooltip="", on_clicked_fn=None
+    label="", type="dropdown", default_val=0, items=("Option 1", "Option 2", "Option 3"), tooltip="", on_clicked_fn=None
 ):
     """Creates a Stylized Dropdown Combobox
 
@@ -458,22 +563,21 @@ def dropdown_builder(
         label (str, optional): Label to the left of the UI element. Defaults to "".
         type (str, optional): Type of UI element. Defaults to "dropdown".
         default_val (int, optional): Default index of dropdown items. Defaults to 0.
-        items (list, optional): List of items for dropdown box. Defaults to ["Option 1", "Option 2", "Option 3"].
+        items (list, optional): List of items for dropdown box. Defaults to ("Option 1", "Option 2", "Option 3").
         tooltip (str, optional): Tooltip to display over the Label. Defaults to "".
         on_clicked_fn (Callable, optional): Call-back function when clicked. Defaults to None.
 
     Returns:
         AbstractItemModel: model
     """
+    tt = format_tt(tooltip)
     with ui.HStack():
-        ui.Label(label, width=LABEL_WIDTH, alignment=ui.Alignment.LEFT_CENTER, tooltip=format_tt(tooltip))
-        combo_box = ui.ComboBox(
-            default_val, *items, name="ComboBox", width=ui.Fraction(1), alignment=ui.Alignment.LEFT_CENTER
-        ).model
+        _label(label, tt)
+        combo_box = ui.ComboBox(default_val, *items, name="ComboBox", width=ui.Fraction(1), alignment=_ALIGN_LC).model
         add_line_rect_flourish(False)
 
-        def on_clicked_wrapper(model, val):
-            on_clicked_fn(items[model.get_item_value_model().as_int])
+        def on_clicked_wrapper(model, val, _items=items, _cb=on_clicked_fn):
+            _cb(_items[model.get_item_value_model().as_int])
 
         if on_clicked_fn is not None:
             combo_box.add_item_changed_fn(on_clicked_wrapper)
@@ -482,7 +586,7 @@ def dropdown_builder(
 
 
 def combo_intfield_slider_builder(
-    label="", type="intfield_stringfield", default_val=0.5, min=0, max=1, step=0.01, tooltip=["", ""]
+    label="", type="intfield_stringfield", default_val=0.5, min=0, max=1, step=0.01, tooltip=("", "")
 ):
     """Creates a Stylized IntField + Stringfield Widget
 
@@ -493,28 +597,25 @@ def combo_intfield_slider_builder(
         min (int, optional): Minimum Value. Defaults to 0.
         max (int, optional): Maximum Value. Defaults to 1.
         step (float, optional): Step. Defaults to 0.01.
-        tooltip (list, optional): List of tooltips. Defaults to ["", ""].
+        tooltip (list, optional): List of tooltips. Defaults to ("", "").
 
     Returns:
         Tuple(AbstractValueModel, IntSlider): (flt_field_model, flt_slider_model)
     """
+    tts = [format_tt(t) for t in tooltip]
     with ui.HStack():
-        ui.Label(label, width=LABEL_WIDTH, alignment=ui.Alignment.LEFT_CENTER, tooltip=format_tt(tooltip[0]))
-        ff = ui.IntDrag(
-            name="Field", width=BUTTON_WIDTH / 2, alignment=ui.Alignment.LEFT_CENTER, tooltip=format_tt(tooltip[1])
-        ).model
+        _label(label, tts[0])
+        ff = ui.IntDrag(name="Field", width=BUTTON_WIDTH / 2, alignment=_ALIGN_LC, tooltip=tts[1]).model
         ff.set_value(default_val)
         ui.Spacer(width=5)
-        fs = ui.IntSlider(
-            width=ui.Fraction(1), alignment=ui.Alignment.LEFT_CENTER, min=min, max=max, step=step, model=ff
-        )
+        fs = ui.IntSlider(width=ui.Fraction(1), alignment=_ALIGN_LC, min=min, max=max, step=step, model=ff)
 
         add_line_rect_flourish(False)
         return ff, fs
 
 
 def combo_floatfield_slider_builder(
-    label="", type="floatfield_stringfield", default_val=0.5, min=0, max=1, step=0.01, tooltip=["", ""]
+    label="", type="floatfield_stringfield", default_val=0.5, min=0, max=1, step=0.01, tooltip=("", "")
 ):
     """Creates a Stylized FloatField + FloatSlider Widget
 
@@ -525,21 +626,18 @@ def combo_floatfield_slider_builder(
         min (int, optional): Minimum Value. Defaults to 0.
         max (int, optional): Maximum Value. Defaults to 1.
         step (float, optional): Step. Defaults to 0.01.
-        tooltip (list, optional): List of tooltips. Defaults to ["", ""].
+        tooltip (list, optional): List of tooltips. Defaults to ("", "").
 
     Returns:
         Tuple(AbstractValueModel, IntSlider): (flt_field_model, flt_slider_model)
     """
+    tts = [format_tt(t) for t in tooltip]
     with ui.HStack():
-        ui.Label(label, width=LABEL_WIDTH, alignment=ui.Alignment.LEFT_CENTER, tooltip=format_tt(tooltip[0]))
-        ff = ui.FloatField(
-            name="Field", width=BUTTON_WIDTH / 2, alignment=ui.Alignment.LEFT_CENTER, tooltip=format_tt(tooltip[1])
-        ).model
+        _label(label, tts[0])
+        ff = ui.FloatField(name="Field", width=BUTTON_WIDTH / 2, alignment=_ALIGN_LC, tooltip=tts[1]).model
         ff.set_value(default_val)
         ui.Spacer(width=5)
-        fs = ui.FloatSlider(
-            width=ui.Fraction(1), alignment=ui.Alignment.LEFT_CENTER, min=min, max=max, step=step, model=ff
-        )
+        fs = ui.FloatSlider(width=ui.Fraction(1), alignment=_ALIGN_LC, min=min, max=max, step=step, model=ff)
 
         add_line_rect_flourish(False)
         return ff, fs
@@ -549,10 +647,10 @@ def multi_dropdown_builder(
     label="",
     type="multi_dropdown",
     count=2,
-    default_val=[0, 0],
-    items=[["Option 1", "Option 2", "Option 3"], ["Option A", "Option B", "Option C"]],
+    default_val=(0, 0),
+    items=(("Option 1", "Option 2", "Option 3"), ("Option A", "Option B", "Option C")),
     tooltip="",
-    on_clicked_fn=[None, None],
+    on_clicked_fn=None,
 ):
     """Creates a Stylized Multi-Dropdown Combobox
 
@@ -563,26 +661,25 @@ def multi_dropdown_builder(
         label (str, optional): Label to the left of the UI element. Defaults to "".
         type (str, optional): Type of UI element. Defaults to "multi_dropdown".
         count (int, optional): Number of UI elements. Defaults to 2.
-        default_val (list(int), optional): List of default indices of dropdown items. Defaults to 0.. Defaults to [0, 0].
-        items (list(list), optional): List of list of items for dropdown boxes. Defaults to [["Option 1", "Option 2", "Option 3"], ["Option A", "Option B", "Option C"]].
+        default_val (list(int), optional): List of default indices of dropdown items. Defaults to 0.. Defaults to (0, 0).
+        items (list(list), optional): List of list of items for dropdown boxes. Defaults to (("Option 1", "Option 2", "Option 3"), ("Option A", "Option B", "Option C")).
         tooltip (str, optional): Tooltip to display over the Label. Defaults to "".
-        on_clicked_fn (list(Callable), optional): List of call-back function when clicked. Defaults to [None, None].
+        on_clicked_fn (list(Callable), optional): List of call-back function when clicked. Defaults to None.
 
     Returns:
         list(AbstractItemModel): list(models)
     """
+    on_clicked_fn = on_clicked_fn or (None,) * count
     elems = []
+    tt = format_tt(tooltip)
     with ui.HStack():
-        ui.Label(label, width=LABEL_WIDTH, alignment=ui.Alignment.LEFT_CENTER, tooltip=format_tt(tooltip))
+        _label(label, tt)
         for i in range(count):
-            elem = ui.ComboBox(
-                default_val[i], *items[i], name="ComboBox", width=ui.Fraction(1), alignment=ui.Alignment.LEFT_CENTER
-            )
-
-            def on_clicked_wrapper(model, val, index):
-                on_clicked_fn[index](items[index][model.get_item_value_model().as_int])
-
-            elem.model.add_item_changed_fn(lambda m, v, index=i: on_clicked_wrapper(m, v, index))
+            elem = ui.ComboBox(default_val[i], *items[i], name="ComboBox", width=ui.Fraction(1), alignment=_ALIGN_LC)
+            if on_clicked_fn[i] is not None:
+                elem.model.add_item_changed_fn(
+                    lambda m, v, _items=items[i], _cb=on_clicked_fn[i]: _cb(_items[m.get_item_value_model().as_int])
+                )
             elems.append(elem)
             if i < count - 1:
                 ui.Spacer(width=5)
@@ -593,37 +690,37 @@ def multi_dropdown_builder(
 def combo_cb_dropdown_builder(
     label="",
     type="checkbox_dropdown",
-    default_val=[False, 0],
-    items=["Option 1", "Option 2", "Option 3"],
+    default_val=(False, 0),
+    items=("Option 1", "Option 2", "Option 3"),
     tooltip="",
-    on_clicked_fn=[lambda x: None, None],
+    on_clicked_fn=None,
 ):
     """Creates a Stylized Dropdown Combobox with an Enable Checkbox
 
     Args:
         label (str, optional): Label to the left of the UI element. Defaults to "".
         type (str, optional): Type of UI element. Defaults to "checkbox_dropdown".
-        default_val (list, optional): list(cb_default, dropdown_default). Defaults to [False, 0].
-        items (list, optional): List of items for dropdown box. Defaults to ["Option 1", "Option 2", "Option 3"].
+        default_val (list, optional): list(cb_default, dropdown_default). Defaults to (False, 0).
+        items (list, optional): List of items for dropdown box. Defaults to ("Option 1", "Option 2", "Option 3").
         tooltip (str, optional): Tooltip to display over the Label. Defaults to "".
-        on_clicked_fn (list, optional): List of callback functions. Defaults to [lambda x: None, None].
+        on_clicked_fn (list, optional): List of callback functions. Defaults to None.
 
     Returns:
         Tuple(ui.SimpleBoolModel, ui.ComboBox): (cb_model, combobox)
     """
+    on_clicked_fn = on_clicked_fn or (_noop, None)
+    tt = format_tt(tooltip)
     with ui.HStack():
-        ui.Label(label, width=LABEL_WIDTH - 12, alignment=ui.Alignment.LEFT_CENTER, tooltip=format_tt(tooltip))
+        _label(label, tt, _LABEL_WIDTH_NARROW)
         cb = ui.SimpleBoolModel(default_value=default_val[0])
         SimpleCheckBox(default_val[0], on_clicked_fn[0], model=cb)
-        combo_box = ui.ComboBox(
-            default_val[1], *items, name="ComboBox", width=ui.Fraction(1), alignment=ui.Alignment.LEFT_CENTER
-        )
-
-        def on_clicked_wrapper(model, val):
+        combo_box = ui.ComboBox(default_val[1], *items, name="ComboBox", width=ui.Fraction(1), alignment=_ALIGN_LC)
 
-            on_clicked_fn[1](items[model.get_item_value_model().as_int])
+        def on_clicked_wrapper(model, val, _items=items, _cb=on_clicked_fn[1]):
+            _cb(_items[model.get_item_value_model().as_int])
 
-        combo_box.model.add_item_changed_fn(on_clicked_wrapper)
+        if on_clicked_fn[1] is not None:
+            combo_box.model.add_item_changed_fn(on_clicked_wrapper)
 
         add_line_rect_flourish(False)
 
@@ -643,21 +740,22 @@ def scrolling_frame_builder(label="", type="scrolling_frame", default_val="No Da
         ui.Label: label
     """
 
-    with ui.VStack(style=get_style(), spacing=5):
+    tt = format_tt(tooltip)
+    with ui.VStack(style=_STYLE, spacing=5):
         with ui.HStack():
-            ui.Label(label, width=LABEL_WIDTH, alignment=ui.Alignment.LEFT_TOP, tooltip=format_tt(tooltip))
+            _label(label, tt, align=_ALIGN_LT)
             with ui.ScrollingFrame(
                 height=LABEL_HEIGHT * 5,
                 style_type_name_override="ScrollingFrame",
-                alignment=ui.Alignment.LEFT_TOP,
-                horizontal_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED,
-                vertical_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_ALWAYS_ON,
+                alignment=_ALIGN_LT,
+                horizontal_scrollbar_policy=_SBAR_AS_NEEDED,
+                vertical_scrollbar_policy=_SBAR_ALWAYS_ON,
             ):
                 text = ui.Label(
                     default_val,
                     style_type_name_override="Label::label",
                     word_wrap=True,
-                    alignment=ui.Alignment.LEFT_TOP,
+                    alignment=_ALIGN_LT,
                 )
             with ui.Frame(width=0, tooltip="Copy To Clipboard"):
                 ui.Button(
@@ -665,21 +763,21 @@ def scrolling_frame_builder(label="", type="scrolling_frame", default_val="No Da
                     width=20,
                     height=20,
                     clicked_fn=lambda: on_copy_to_clipboard(to_copy=text.text),
-                    style=get_style()["IconButton.Image::CopyToClipboard"],
-                    alignment=ui.Alignment.RIGHT_TOP,
+                    style=_COPY_ICON_STYLE,
+                    alignment=_ALIGN_RT,
                 )
     return text
 
 
 def combo_cb_scrolling_frame_builder(
-    label="", type="cb_scrolling_frame", default_val=[False, "No Data"], tooltip="", on_clicked_fn=lambda x: None
+    label="", type="cb_scrolling_frame", default_val=(False, "No Data"), tooltip="", on_clicked_fn=lambda x: None
 ):
     """Creates a Labeled, Checkbox-enabled Scrolling Frame with CopyToClipboard button
 
     Args:
         label (str, optional): Label to the left of the UI element. Defaults to "".
         type (str, optional): Type of UI element. Defaults to "cb_scrolling_frame".
-        default_val (list, optional): List of Checkbox and Frame Defaults. Defaults to [False, "No Data"].
+        default_val (list, optional): List of Checkbox and Frame Defaults. Defaults to (False, "No Data").
         tooltip (str, optional): Tooltip to display over the Label. Defaults to "".
         on_clicked_fn (Callable, optional): Callback function when clicked. Defaults to lambda x : None.
 
@@ -687,9 +785,10 @@ def combo_cb_scrolling_frame_builder(
         list(SimpleBoolModel, ui.Label): (model, label)
     """
 
-    with ui.VStack(style=get_style(), spacing=5):
+    tt = format_tt(tooltip)
+    with ui.VStack(style=_STYLE, spacing=5):
         with ui.HStack():
-            ui.Label(label, width=LABEL_WIDTH - 12, alignment=ui.Alignment.LEFT_TOP, tooltip=format_tt(tooltip))
+            _label(label, tt, _LABEL_WIDTH_NARROW, _ALIGN_LT)
             with ui.VStack(width=0):
                 cb = ui.SimpleBoolModel(default_value=default_val[0])
                 SimpleCheckBox(default_val[0], on_clicked_fn, model=cb)
@@ -697,15 +796,15 @@ def combo_cb_scrolling_frame_builder(
             with ui.ScrollingFrame(
                 height=18 * 5,
                 style_type_name_override="ScrollingFrame",
-                alignment=ui.Alignment.LEFT_TOP,
-                horizontal_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED,
-                vertical_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_ALWAYS_ON,
+                alignment=_ALIGN_LT,
+                horizontal_scrollbar_policy=_SBAR_AS_NEEDED,
+                vertical_scrollbar_policy=_SBAR_ALWAYS_ON,
             ):
                 text = ui.Label(
                     default_val[1],
                     style_type_name_override="Label::label",
                     word_wrap=True,
-                    alignment=ui.Alignment.LEFT_TOP,
+                    alignment=_ALIGN_LT,
                 )
 
             with ui.Frame(width=0, tooltip="Copy to Clipboard"):
@@ -714,8 +813,8 @@ def combo_cb_scrolling_frame_builder(
                     width=20,
                     height=20,
                     clicked_fn=lambda: on_copy_to_clipboard(to_copy=text.text),
-                    style=get_style()["IconButton.Image::CopyToClipboard"],
-                    alignment=ui.Alignment.RIGHT_TOP,
+                    style=_COPY_ICON_STYLE,
+                    alignment=_ALIGN_RT,
                 )
     return cb, text
 
@@ -724,11 +823,11 @@ def xyz_builder(
     label="",
     tooltip="",
     axis_count=3,
-    default_val=[0.0, 0.0, 0.0, 0.0],
+    default_val=(0.0, 0.0, 0.0, 0.0),
     min=float("-inf"),
     max=float("inf"),
     step=0.001,
-    on_value_changed_fn=[None, None, None, None],
+    on_value_changed_fn=None,
 ):
     """[summary]
 
@@ -736,11 +835,12 @@ def xyz_builder(
         label (str, optional): Label to the left of the UI element. Defaults to "".
         type (str, optional): Type of UI element. Defaults to "".
         axis_count (int, optional): Number of Axes to Display. Max 4. Defaults to 3.
-        default_val (list, optional): List of default values. Defaults to [0.0, 0.0, 0.0, 0.0].
+        default_val (list, optional): List of default values. Defaults to (0.0, 0.0, 0.0, 0.0).
         min (float, optional): Minimum Float Value. Defaults to float("-inf").
         max (float, optional): Maximum Float Value. Defaults to float("inf").
         step (float, optional): Step. Defaults to 0.001.
-        on_value_changed_fn (list, optional): List of callback functions for each axes. Defaults to [None, None, None, None].
+        on_value_changed_fn (list, optional): List of callback functions for each axes, called once per app
+            update with the latest value rather than on every change. Defaults to None.
 
     Returns:
         list(AbstractValueModel): list(model)
@@ -748,64 +848,76 @@ def xyz_builder(
 
     # These styles & colors are taken from omni.kit.property.transform_builder.py _create_multi_float_drag_matrix_with_labels
     if axis_count <= 0 or axis_count > 4:
-        import builtins
-
         carb.log_warn("Invalid axis_count: must be in range 1 to 4. Clamping to default range.")
         axis_count = builtins.max(builtins.min(axis_count, 4), 1)
+    on_value_changed_fn = on_value_changed_fn or (None,) * axis_count
 
-    field_labels = [("X", COLOR_X), ("Y", COLOR_Y), ("Z", COLOR_Z), ("W", COLOR_W)]
-    field_tooltips = ["X Value", "Y Value", "Z Value", "W Value"]
     RECT_WIDTH = 13
     # SPACING = 4
-    val_models = [None] * axis_count
+    tt = format_tt(tooltip)
     with ui.HStack():
-        ui.Label(label, width=LABEL_WIDTH, alignment=ui.Alignment.LEFT_CENTER, tooltip=format_tt(tooltip))
+        _label(label, tt)
         with ui.ZStack():
             with ui.HStack():
                 ui.Spacer(width=RECT_WIDTH)
-                for i in range(axis_count):
-                    val_models[i] = ui.FloatDrag(
-                        name="Field",
-                        height=LABEL_HEIGHT,
-                        min=min,
-                        max=max,
-                        step=step,
-                        alignment=ui.Alignment.LEFT_CENTER,
-                        tooltip=field_tooltips[i],
-                    ).model
-                    val_models[i].set_value(default_val[i])
-                    if on_value_changed_fn[i] is not None:
-                        val_models[i].add_value_changed_fn(on_value_changed_fn[i])
-                    if i != axis_count - 1:
-                        ui.Spacer(width=19)
+                multi_model = ui.MultiFloatDragField(
+                    *default_val[:axis_count],
+                    name="Field",
+                    height=LABEL_HEIGHT,
+                    min=min,
+                    max=max,
+                    step=step,
+                    h_spacing=19,
+                    # One tooltip for the whole field, so it names every axis it holds
+                    tooltip=", ".join(_FIELD_TOOLTIPS[:axis_count]),
+                ).model
+                items = multi_model.get_item_children()
+                val_models = [multi_model.get_item_value_model(item) for item in items]
+                throttlers = [_Throttler(fn) if fn is not None else None for fn in on_value_changed_fn[:axis_count]]
+                if any(throttlers):
+                    item_indices = {item: i for i, item in enumerate(items)}
+
+                    def on_item_changed(model, item, _indices=item_indices, _models=val_models, _throttlers=throttlers):
+                        # A None item means the whole model changed, items that are not axes are ignored
+                        if item is None:
+                            indices = range(len(_models))
+                        else:
+                            indices = (_indices[item],) if item in _indices else ()
+                        for i in indices:
+                            if _throttlers[i] is not None:
+                                _throttlers[i].notify(_models[i])
+
+                    multi_model.add_item_changed_fn(on_item_changed)
             with ui.HStack():
                 for i in range(axis_count):
                     if i != 0:
                         ui.Spacer()  # width=BUTTON_WIDTH - 1)
-                    field_label = field_labels[i]
+                    field_label = _FIELD_LABELS[i]
                     with ui.ZStack(width=RECT_WIDTH + 2 * i):
                         ui.Rectangle(name="vector_label", style={"background_color": field_label[1]})
-                        ui.Label(field_label[0], name="vector_label", alignment=ui.Alignment.CENTER)
+                        ui.Label(field_label[0], name="vector_label", alignment=_ALIGN_CENTER)
                 ui.Spacer()
         add_line_rect_flourish(False)
         return val_models
 
 
-def color_picker_builder(label="", type="color_picker", default_val=[1.0, 1.0, 1.0, 1.0], tooltip="Color Picker"):
+def color_picker_builder(label="", type="color_picker", default_val=(1.0, 1.0, 1.0, 1.0), tooltip="Color Picker"):
     """Creates a Color Picker Widget
 
     Args:
         label (str, optional): Label to the left of the UI element. Defaults to "".
         type (str, optional): Type of UI element. Defaults to "color_picker".
-        default_val (list, optional): List of (R,G,B,A) default values. Defaults to [1.0, 1.0, 1.0, 1.0].
+        default_val (list, optional): List of (R,G,B,A) default values. Defaults to (1.0, 1.0, 1.0, 1.0).
         tooltip (str, optional): Tooltip to display over the Label. Defaults to "Color Picker".
 
     Returns:
         AbstractItemModel: ui.ColorWidget.model
     """
+    tt = format_tt(tooltip)
     with ui.HStack():
-        ui.Label(label, width=LABEL_WIDTH, alignment=ui.Alignment.LEFT_CENTER, tooltip=format_tt(tooltip))
-        model = ui.ColorWidget(*default_val, width=BUTTON_WIDTH).model
+        _label(label, tt)
+        r, g, b, a = default_val
+        model = ui.ColorWidget(r, g, b, a, width=BUTTON_WIDTH).model
         ui.Spacer(width=5)
         add_line_rect_flourish()
     return model
@@ -824,14 +936,47 @@ def progress_bar_builder(label="", type="progress_bar", default_val=0, tooltip="
         AbstractValueModel: ui.ProgressBar().model
     """
     with ui.HStack():
-        ui.Label(label, width=LABEL_WIDTH, alignment=ui.Alignment.LEFT_CENTER)
+        ui.Label(label, width=LABEL_WIDTH, alignment=_ALIGN_LC)
         model = ui.ProgressBar().model
         model.set_value(default_val)
         add_line_rect_flourish(False)
     return model
 
 
-def plot_builder(label="", data=None, min=-1, max=1, type=ui.Type.LINE, value_stride=1, color=None, tooltip=""):
+def _build_minmax_fields(plots, min, max):
+    """Builds the Max/Min fields to the right of a plot row that rescale every plot in `plots`
+
+    Args:
+        plots (tuple(ui.Plot)): Plots rescaled by the fields.
+        min (float): Initial Min Y Value.
+        max (float): Initial Max Y Value.
+    """
+
+    def update_min(model):
+        value = model.as_float
+        for plot in plots:
+            plot.scale_min = value
+
+    def update_max(model):
+        value = model.as_float
+        for plot in plots:
+            plot.scale_max = value
+
+    ui.Spacer(width=5)
+    with ui.Frame(width=0):
+        with ui.VStack(spacing=5):
+            max_model = ui.FloatDrag(name="Field", width=40, alignment=_ALIGN_LB, tooltip="Max").model
+            max_model.set_value(max)
+            min_model = ui.FloatDrag(name="Field", width=40, alignment=_ALIGN_LT, tooltip="Min").model
+            min_model.set_value(min)
+
+            _Throttler(update_min).attach(min_model)
+            _Throttler(update_max).attach(max_model)
+
+
+def plot_builder(
+    label="", data=None, min=-1, max=1, plot_type=ui.Type.LINE, value_stride=1, color=0xFFDDDDDD, tooltip=""
+):
     """Creates a stylized static plot
 
     Args:
@@ -839,26 +984,25 @@ def plot_builder(label="", data=None, min=-1, max=1, type=ui.Type.LINE, value_st
         data (list(float), optional): Data to plot. Defaults to None.
         min (int, optional): Minimum Y Value. Defaults to -1.
         max (int, optional): Maximum Y Value. Defaults to 1.
-        type (ui.Type, optional): Plot Type. Defaults to ui.Type.LINE.
+        plot_type (ui.Type, optional): Plot Type. Defaults to ui.Type.LINE.
         value_stride (int, optional): Width of plot stride. Defaults to 1.
-        color (int, optional): Plot color. Defaults to None.
+        color (int, optional): Plot color. Defaults to 0xFFDDDDDD.
         tooltip (str, optional): Tooltip to display over the Label. Defaults to "".
 
     Returns:
         ui.Plot: plot
     """
+    tt = format_tt(tooltip)
     with ui.VStack(spacing=5):
         with ui.HStack():
-            ui.Label(label, width=LABEL_WIDTH, alignment=ui.Alignment.LEFT_TOP, tooltip=format_tt(tooltip))
+            _label(label, tt, align=_ALIGN_LT)
 
             plot_height = LABEL_HEIGHT * 2 + 13
             plot_width = ui.Fraction(1)
             with ui.ZStack():
                 ui.Rectangle(width=plot_width, height=plot_height)
-                if not color:
-                    color = 0xFFDDDDDD
                 plot = ui.Plot(
-                    type,
+                    plot_type,
                     min,
                     max,
                     *data,
@@ -868,26 +1012,7 @@ def plot_builder(label="", data=None, min=-1, max=1, type=ui.Type.LINE, value_st
                     style={"color": color, "background_color": 0x0},
                 )
 
-            def update_min(model):
-                plot.scale_min = model.as_float
-
-            def update_max(model):
-                plot.scale_max = model.as_float
-
-            ui.Spacer(width=5)
-            with ui.Frame(width=0):
-                with ui.VStack(spacing=5):
-                    max_model = ui.FloatDrag(
-                        name="Field", width=40, alignment=ui.Alignment.LEFT_BOTTOM, tooltip="Max"
-                    ).model
-                    max_model.set_value(max)
-                    min_model = ui.FloatDrag(
-                        name="Field", width=40, alignment=ui.Alignment.LEFT_TOP, tooltip="Min"
-                    ).model
-                    min_model.set_value(min)
-
-                    min_model.add_value_changed_fn(update_min)
-                    max_model.add_value_changed_fn(update_max)
+            _build_minmax_fields((plot,), min, max)
 
             ui.Spacer(width=20)
         add_separator()
@@ -895,12 +1020,12 @@ def plot_builder(label="", data=None, min=-1, max=1, type=ui.Type.LINE, value_st
     return plot
 
 
-def xyz_plot_builder(label="", data=[], min=-1, max=1, tooltip=""):
+def xyz_plot_builder(label="", data=None, min=-1, max=1, tooltip=""):
     """Creates a stylized static XYZ plot
 
     Args:
         label (str, optional): Label to the left of the UI element. Defaults to "".
-        data (list(float), optional): Data to plot. Defaults to [].
+        data (list(float), optional): Data to plot. Defaults to None.
         min (int, optional): Minimum Y Value. Defaults to -1.
         max (int, optional): Maximum Y Value. Defaults to "".
         tooltip (str, optional): Tooltip to display over the Label.. Defaults to "".
@@ -908,71 +1033,34 @@ def xyz_plot_builder(label="", data=[], min=-1, max=1, tooltip=""):
     Returns:
         list(ui.Plot): list(x_plot, y_plot, z_plot)
     """
+    tt = format_tt(tooltip)
     with ui.VStack(spacing=5):
         with ui.HStack():
-            ui.Label(label, width=LABEL_WIDTH, alignment=ui.Alignment.LEFT_TOP, tooltip=format_tt(tooltip))
+            _label(label, tt, align=_ALIGN_LT)
 
             plot_height = LABEL_HEIGHT * 2 + 13
             plot_width = ui.Fraction(1)
             with ui.ZStack():
                 ui.Rectangle(width=plot_width, height=plot_height)
 
-                plot_0 = ui.Plot(
-                    ui.Type.LINE,
-                    min,
-                    max,
-                    *data[0],
-                    width=plot_width,
-                    height=plot_height,
-                    style=get_style()["PlotLabel::X"],
-                )
-                plot_1 = ui.Plot(
-                    ui.Type.LINE,
-                    min,
-                    max,
-                    *data[1],
-                    width=plot_width,
-                    height=plot_height,
-                    style=get_style()["PlotLabel::Y"],
-                )
-                plot_2 = ui.Plot(
-                    ui.Type.LINE,
-                    min,
-                    max,
-                    *data[2],
-                    width=plot_width,
-                    height=plot_height,
-                    style=get_style()["PlotLabel::Z"],
+                plots = tuple(
+                    ui.Plot(
+                        ui.Type.LINE,
+                        min,
+                        max,
+                        *values,
+                        width=plot_width,
+                        height=plot_height,
+                        style=style,
+                    )
+                    for values, style in zip(data, _PLOT_XYZ_STYLES)
                 )
 
-            def update_min(model):
-                plot_0.scale_min = model.as_float
-                plot_1.scale_min = model.as_float
-                plot_2.scale_min = model.as_float
-
-            def update_max(model):
-                plot_0.scale_max = model.as_float
-                plot_1.scale_max = model.as_float
-                plot_2.scale_max = model.as_float
-
-            ui.Spacer(width=5)
-            with ui.Frame(width=0):
-                with ui.VStack(spacing=5):
-                    max_model = ui.FloatDrag(
-                        name="Field", width=40, alignment=ui.Alignment.LEFT_BOTTOM, tooltip="Max"
-                    ).model
-                    max_model.set_value(max)
-                    min_model = ui.FloatDrag(
-                        name="Field", width=40, alignment=ui.Alignment.LEFT_TOP, tooltip="Min"
-                    ).model
-                    min_model.set_value(min)
-
-                    min_model.add_value_changed_fn(update_min)
-                    max_model.add_value_changed_fn(update_max)
+            _build_minmax_fields(plots, min, max)
             ui.Spacer(width=20)
 
         add_separator()
-        return [plot_0, plot_1, plot_2]
+        return list(plots)
 
 
 def combo_cb_plot_builder(
@@ -982,9 +1070,9 @@ def combo_cb_plot_builder(
     data=None,
     min=-1,
     max=1,
-    type=ui.Type.LINE,
+    plot_type=ui.Type.LINE,
     value_stride=1,
-    color=None,
+    color=0xFFDDDDDD,
     tooltip="",
 ):
     """Creates a Checkbox-Enabled dyanamic plot
@@ -996,19 +1084,20 @@ def combo_cb_plot_builder(
         data (list(), optional): Data to plat. Defaults to None.
         min (int, optional): Min Y Value. Defaults to -1.
         max (int, optional): Max Y Value. Defaults to 1.
-        type (ui.Type, optional): Plot Type. Defaults to ui.Type.LINE.
+        plot_type (ui.Type, optional): Plot Type. Defaults to ui.Type.LINE.
         value_stride (int, optional): Width of plot stride. Defaults to 1.
-        color (int, optional): Plot color. Defaults to None.
+        color (int, optional): Plot color. Defaults to 0xFFDDDDDD.
         tooltip (str, optional): Tooltip to display over the Label. Defaults to "".
 
 
     Returns:
         list(SimpleBoolModel, ui.Plot): (cb_model, plot)
     """
+    tt = format_tt(tooltip)
     with ui.VStack(spacing=5):
         with ui.HStack():
             # Label
-            ui.Label(label, width=LABEL_WIDTH, alignment=ui.Alignment.LEFT_TOP, tooltip=format_tt(tooltip))
+            _label(label, tt, align=_ALIGN_LT)
             # Checkbox
             with ui.Frame(width=0):
                 with ui.Placer(offset_x=-10, offset_y=0):
@@ -1021,10 +1110,8 @@ def combo_cb_plot_builder(
             plot_width = ui.Fraction(1)
             with ui.ZStack():
                 ui.Rectangle(width=plot_width, height=plot_height)
-                if not color:
-                    color = 0xFFDDDDDD
                 plot = ui.Plot(
-                    type,
+                    plot_type,
                     min,
                     max,
                     *data,
@@ -1034,28 +1121,7 @@ def combo_cb_plot_builder(
                     style={"color": color, "background_color": 0x0},
                 )
 
-            # Min/Max Helpers
-            def update_min(model):
-                plot.scale_min = model.as_float
-
-            def update_max(model):
-                plot.scale_max = model.as_float
-
-            ui.Spacer(width=5)
-            with ui.Frame(width=0):
-                with ui.VStack(spacing=5):
-                    # Min/Max Fields
-                    max_model = ui.FloatDrag(
-                        name="Field", width=40, alignment=ui.Alignment.LEFT_BOTTOM, tooltip="Max"
-                    ).model
-                    max_model.set_value(max)
-                    min_model = ui.FloatDrag(
-                        name="Field", width=40, alignment=ui.Alignment.LEFT_TOP, tooltip="Min"
-                    ).model
-                    min_model.set_value(min)
-
-                    min_model.add_value_changed_fn(update_min)
-                    max_model.add_value_changed_fn(update_max)
+            _build_minmax_fields((plot,), min, max)
             ui.Spacer(width=20)
         with ui.HStack():
             ui.Spacer(width=LABEL_WIDTH + 29)
@@ -1065,7 +1131,7 @@ def combo_cb_plot_builder(
                 width=BUTTON_WIDTH,
                 height=LABEL_HEIGHT,
                 enabled=False,
-                alignment=ui.Alignment.LEFT_CENTER,
+                alignment=_ALIGN_LC,
                 tooltip="Value",
             ).model
         add_separator()
@@ -1076,10 +1142,10 @@ def combo_cb_xyz_plot_builder(
     label="",
     default_val=False,
     on_clicked_fn=lambda x: None,
-    data=[],
+    data=None,
     min=-1,
     max=1,
-    type=ui.Type.LINE,
+    plot_type=ui.Type.LINE,
     value_stride=1,
     tooltip="",
 ):
@@ -1092,16 +1158,17 @@ def combo_cb_xyz_plot_builder(
         data list(), optional): Data to plat. Defaults to None.
         min (int, optional): Min Y Value. Defaults to -1.
         max (int, optional): Max Y Value. Defaults to 1.
-        type (ui.Type, optional): Plot Type. Defaults to ui.Type.LINE.
+        plot_type (ui.Type, optional): Plot Type. Defaults to ui.Type.LINE.
         value_stride (int, optional): Width of plot stride. Defaults to 1.
         tooltip (str, optional): Tooltip to display over the Label. Defaults to "".
 
     Returns:
         Tuple(list(ui.Plot), list(AbstractValueModel)): ([plot_0, plot_1, plot_2], [val_model_x, val_model_y, val_model_z])
     """
+    tt = format_tt(tooltip)
     with ui.VStack(spacing=5):
         with ui.HStack():
-            ui.Label(label, width=LABEL_WIDTH, alignment=ui.Alignment.LEFT_TOP, tooltip=format_tt(tooltip))
+            _label(label, tt, align=_ALIGN_LT)
             # Checkbox
             with ui.Frame(width=0):
                 with ui.Placer(offset_x=-10, offset_y=0):
@@ -1115,68 +1182,27 @@ def combo_cb_xyz_plot_builder(
             with ui.ZStack():
                 ui.Rectangle(width=plot_width, height=plot_height)
 
-                plot_0 = ui.Plot(
-                    type,
-                    min,
-                    max,
-                    *data[0],
-                    value_stride=value_stride,
-                    width=plot_width,
-                    height=plot_height,
-                    style=get_style()["PlotLabel::X"],
-                )
-                plot_1 = ui.Plot(
-                    type,
-                    min,
-                    max,
-                    *data[1],
-                    value_stride=value_stride,
-                    width=plot_width,
-                    height=plot_height,
-                    style=get_style()["PlotLabel::Y"],
-                )
-                plot_2 = ui.Plot(
-                    type,
-                    min,
-                    max,
-                    *data[2],
-                    value_stride=value_stride,
-                    width=plot_width,
-                    height=plot_height,
-                    style=get_style()["PlotLabel::Z"],
+                plots = tuple(
+                    ui.Plot(
+                        plot_type,
+                        min,
+                        max,
+                        *values,
+                        value_stride=value_stride,
+                        width=plot_width,
+                        height=plot_height,
+                        style=style,
+                    )
+                    for values, style in zip(data, _PLOT_XYZ_STYLES)
                 )
 
-            def update_min(model):
-                plot_0.scale_min = model.as_float
-                plot_1.scale_min = model.as_float
-                plot_2.scale_min = model.as_float
-
-            def update_max(model):
-                plot_0.scale_max = model.as_float
-                plot_1.scale_max = model.as_float
-                plot_2.scale_max = model.as_float
-
-            ui.Spacer(width=5)
-            with ui.Frame(width=0):
-                with ui.VStack(spacing=5):
-                    max_model = ui.FloatDrag(
-                        name="Field", width=40, alignment=ui.Alignment.LEFT_BOTTOM, tooltip="Max"
-                    ).model
-                    max_model.set_value(max)
-                    min_model = ui.FloatDrag(
-                        name="Field", width=40, alignment=ui.Alignment.LEFT_TOP, tooltip="Min"
-                    ).model
-                    min_model.set_value(min)
-
-                    min_model.add_value_changed_fn(update_min)
-                    max_model.add_value_changed_fn(update_max)
+            _build_minmax_fields(plots, min, max)
             ui.Spacer(width=20)
 
         # with ui.HStack():
         #     ui.Spacer(width=40)
         #     val_models = xyz_builder()#**{"args":args})
 
-        field_labels = [("X", COLOR_X), ("Y", COLOR_Y), ("Z", COLOR_Z), ("W", COLOR_W)]
         RECT_WIDTH = 13
         # SPACING = 4
         with ui.HStack():
@@ -1188,43 +1214,28 @@ def combo_cb_xyz_plot_builder(
                     # value_widget = ui.MultiFloatDragField(
                     #     *args, name="multivalue", min=min, max=max, step=step, h_spacing=RECT_WIDTH + SPACING, v_spacing=2
                     # ).model
-                    val_model_x = ui.FloatDrag(
-                        name="Field",
-                        width=BUTTON_WIDTH - 5,
-                        height=LABEL_HEIGHT,
-                        enabled=False,
-                        alignment=ui.Alignment.LEFT_CENTER,
-                        tooltip="X Value",
-                    ).model
-                    ui.Spacer(width=19)
-                    val_model_y = ui.FloatDrag(
-                        name="Field",
-                        width=BUTTON_WIDTH - 5,
-                        height=LABEL_HEIGHT,
-                        enabled=False,
-                        alignment=ui.Alignment.LEFT_CENTER,
-                        tooltip="Y Value",
-                    ).model
-                    ui.Spacer(width=19)
-                    val_model_z = ui.FloatDrag(
-                        name="Field",
-                        width=BUTTON_WIDTH - 5,
-                        height=LABEL_HEIGHT,
-                        enabled=False,
-                        alignment=ui.Alignment.LEFT_CENTER,
-                        tooltip="Z Value",
-                    ).model
-                with ui.HStack():
+                    val_models = []
+                    with ui.HStack(spacing=19):
+                        for i in range(3):
+                            val_models.append(
+                                ui.FloatDrag(
+                                    name="Field",
+                                    width=BUTTON_WIDTH - 5,
+                                    height=LABEL_HEIGHT,
+                                    enabled=False,
+                                    alignment=_ALIGN_LC,
+                                    tooltip=_FIELD_TOOLTIPS[i],
+                                ).model
+                            )
+                with ui.HStack(spacing=BUTTON_WIDTH - 1):
                     for i in range(3):
-                        if i != 0:
-                            ui.Spacer(width=BUTTON_WIDTH - 1)
-                        field_label = field_labels[i]
+                        field_label = _FIELD_LABELS[i]
                         with ui.ZStack(width=RECT_WIDTH + 1):
                             ui.Rectangle(name="vector_label", style={"background_color": field_label[1]})
-                            ui.Label(field_label[0], name="vector_label", alignment=ui.Alignment.CENTER)
+                            ui.Label(field_label[0], name="vector_label", alignment=_ALIGN_CENTER)
 
         add_separator()
-        return [plot_0, plot_1, plot_2], [val_model_x, val_model_y, val_model_z]
+        return list(plots), val_models
 
 
 def add_line_rect_flourish(draw_line=True):
@@ -1234,12 +1245,12 @@ def add_line_rect_flourish(draw_line=True):
         draw_line (bool, optional): Set false to only draw rectangle. Defaults to True.
     """
     if draw_line:
-        ui.Line(style={"color": 0x338A8777}, width=ui.Fraction(1), alignment=ui.Alignment.CENTER)
+        ui.Line(style={"color": 0x338A8777}, width=ui.Fraction(1), alignment=_ALIGN_CENTER)
     ui.Spacer(width=10)
     with ui.Frame(width=0):
         with ui.VStack():
             with ui.Placer(offset_x=0, offset_y=7):
-                ui.Rectangle(height=5, width=5, alignment=ui.Alignment.CENTER)
+                ui.Rectangle(height=5, width=5, alignment=_ALIGN_CENTER)
     ui.Spacer(width=5)
 
 
@@ -1262,20 +1273,27 @@ def add_folder_picker_icon(
     dialog_title="Select Output Folder",
     button_title="Select Folder",
 ):
-    def open_file_picker():
-        def on_selected(filename, path):
-            on_click_fn(filename, path)
-            file_picker.hide()
+    file_picker = None
+
+    def on_selected(filename, path):
+        on_click_fn(filename, path)
+        file_picker.hide()
 
-        def on_canceled(a, b):
-            file_picker.hide()
+    def on_canceled(a, b):
+        file_picker.hide()
 
+    def open_file_picker():
+        # The dialog is built on first use and reused afterwards
+        nonlocal file_picker
+        if file_picker is not None:
+            file_picker.show()
+            return
         file_picker = FilePickerDialog(
             dialog_title,
             allow_multi_selection=False,
             apply_button_label=button_title,
-            click_apply_handler=lambda a, b: on_selected(a, b),
-            click_cancel_handler=lambda a, b: on_canceled(a, b),
+            click_apply_handler=on_selected,
+            click_cancel_handler=on_canceled,
             item_filter_fn=item_filter_fn,
             enable_versioning_pane=True,
         )
@@ -1288,46 +1306,45 @@ def add_folder_picker_icon(
             width=24,
             height=24,
             clicked_fn=open_file_picker,
-            style=get_style()["IconButton.Image::FolderPicker"],
-            alignment=ui.Alignment.RIGHT_TOP,
+            style=_FOLDER_PICKER_ICON_STYLE,
+            alignment=_ALIGN_RT,
         )
 
 
 def add_folder_picker_btn(on_click_fn):
-    def open_folder_picker():
-        def on_selected(a, b):
-            on_click_fn(a, b)
-            folder_picker.hide()
+    folder_picker = None
+
+    def on_selected(a, b):
+        on_click_fn(a, b)
+        folder_picker.hide()
 
-        def on_canceled(a, b):
-            folder_picker.hide()
+    def on_canceled(a, b):
+        folder_picker.hide()
 
+    def open_folder_picker():
+        # The dialog is built on first use and reused afterwards
+        nonlocal folder_picker
+        if folder_picker is not None:
+            folder_picker.show()
+            return
         folder_picker = FilePickerDialog(
             "Select Output Folder",
             allow_multi_selection=False,
             apply_button_label="Select Folder",
-            click_apply_handler=lambda a, b: on_selected(a, b),
-            click_cancel_handler=lambda a, b: on_canceled(a, b),
+            click_apply_handler=on_selected,
+            click_cancel_handler=on_canceled,
         )
 
     with ui.Frame(width=0):
         ui.Button("SELECT", width=BUTTON_WIDTH, clicked_fn=open_folder_picker, tooltip="Select Folder")
 
 
+@functools.lru_cache(maxsize=512)
 def format_tt(tt):
-    import string
-
-    formated = ""
-    i = 0
-    for w in tt.split():
-        if w.isupper():
-            formated += w + " "
-        elif len(w) > 3 or i == 0:
-            formated += string.capwords(w) + " "
-        else:
-            formated += w.lower() + " "
-        i += 1
-    return formated
+    words = [
+        w if w.isupper() else w.capitalize() if len(w) > 3 or i == 0 else w.lower() for i, w in enumerate(tt.split())
+    ]
+    return " ".join(words) + " " if words else ""
 
 
 def setup_ui_headers(
@@ -1363,7 +1380,7 @@ def build_header(
 
     def build_icon_bar():
         """Adds the Utility Buttons to the Title Header"""
-        with ui.Frame(style=get_style(), width=0):
+        with ui.Frame(style=_STYLE, width=0):
             with ui.VStack():
                 with ui.HStack():
                     icon_size = 24
@@ -1373,9 +1390,9 @@ def build_header(
                             width=icon_size,
                             height=icon_size,
                             clicked_fn=lambda: on_open_IDE_clicked(ext_path, file_path),
-                            style=get_style()["IconButton.Image::OpenConfig"],
+                            style=_OPEN_CONFIG_ICON_STYLE,
                             # style_type_name_override="IconButton.Image::OpenConfig",
-                            alignment=ui.Alignment.LEFT_CENTER,
+                            alignment=_ALIGN_LC,
                             # tooltip="Open in IDE",
                         )
                     with ui.Frame(tooltip="Open Containing Folder"):
@@ -1384,8 +1401,8 @@ def build_header(
                             width=icon_size,
                             height=icon_size,
                             clicked_fn=lambda: on_open_folder_clicked(file_path),
-                            style=get_style()["IconButton.Image::OpenFolder"],
-                            alignment=ui.Alignment.LEFT_CENTER,
+                            style=_OPEN_FOLDER_ICON_STYLE,
+                            alignment=_ALIGN_LC,
                         )
                     with ui.Placer(offset_x=0, offset_y=3):
                         with ui.Frame(tooltip="Link to Docs"):
@@ -1394,8 +1411,8 @@ def build_header(
                                 width=icon_size - icon_size * 0.25,
                                 height=icon_size - icon_size * 0.25,
                                 clicked_fn=lambda: on_docs_link_clicked(doc_link),
-                                style=get_style()["IconButton.Image::OpenLink"],
-                                alignment=ui.Alignment.LEFT_TOP,
+                                style=_OPEN_LINK_ICON_STYLE,
+                                alignment=_ALIGN_LT,
                             )
 
     with ui.ZStack():
@@ -1415,30 +1432,30 @@ def build_info_frame(overview=""):
         height=0,
         collapsed=True,
         horizontal_clipping=False,
-        style=get_style(),
+        style=_STYLE,
         style_type_name_override="CollapsableFrame",
-        horizontal_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED,
-        vertical_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_ALWAYS_ON,
+        horizontal_scrollbar_policy=_SBAR_AS_NEEDED,
+        vertical_scrollbar_policy=_SBAR_ALWAYS_ON,
     )
     with frame:
         label = "Overview"
         default_val = overview
-        tooltip = "Overview"
-        with ui.VStack(style=get_style(), spacing=5):
+        tt = format_tt("Overview")
+        with ui.VStack(spacing=5):
             with ui.HStack():
-                ui.Label(label, width=LABEL_WIDTH / 2, alignment=ui.Alignment.LEFT_TOP, tooltip=format_tt(tooltip))
+                _label(label, tt, LABEL_WIDTH / 2, _ALIGN_LT)
                 with ui.ScrollingFrame(
                     height=LABEL_HEIGHT * 5,
                     style_type_name_override="ScrollingFrame",
-                    alignment=ui.Alignment.LEFT_TOP,
-                    horizontal_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED,
-                    vertical_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_ALWAYS_ON,
+                    alignment=_ALIGN_LT,
+                    horizontal_scrollbar_policy=_SBAR_AS_NEEDED,
+                    vertical_scrollbar_policy=_SBAR_ALWAYS_ON,
                 ):
                     text = ui.Label(
                         default_val,
                         style_type_name_override="Label::label",
                         word_wrap=True,
-                        alignment=ui.Alignment.LEFT_TOP,
+                        alignment=_ALIGN_LT,
                     )
                 with ui.Frame(width=0, tooltip="Copy To Clipboard"):
                     ui.Button(
@@ -1446,8 +1463,8 @@ def build_info_frame(overview=""):
                         width=20,
                         height=20,
                         clicked_fn=lambda: on_copy_to_clipboard(to_copy=text.text),
-                        style=get_style()["IconButton.Image::CopyToClipboard"],
-                        alignment=ui.Alignment.RIGHT_TOP,
+                        style=_COPY_ICON_STYLE,
+                        alignment=_ALIGN_RT,
                     )
     return
 
@@ -1499,9 +1516,18 @@ def build_info_frame(overview=""):
 
 
 class SearchListItem(ui.AbstractItem):
-    def __init__(self, text):
+    def __init__(self, text, on_renamed_fn=None):
         super().__init__()
         self.name_model = ui.SimpleStringModel(text)
+        # Lowercase copy of the name used by the search filter, kept in sync on rename
+        self.lower_name = text.lower()
+        self._on_renamed_fn = on_renamed_fn
+        self.name_model.add_value_changed_fn(self._on_name_changed)
+
+    def _on_name_changed(self, model):
+        self.lower_name = model.as_string.lower()
+        if self._on_renamed_fn is not None:
+            self._on_renamed_fn(self)
 
     def __repr__(self):
         return f'"{self.name_model.as_string}"'
@@ -1519,10 +1545,26 @@ class SearchListItemModel(ui.AbstractItemModel):
         ui.TreeView(model)
     """
 
-    def __init__(self, *args):
+    # Seconds to wait after the last keystroke before filtering
+    FILTER_DELAY = 0.1
+
+    def __init__(self, *args, max_hits=200):
         super().__init__()
-        self._children = [SearchListItem(t) for t in args]
-        self._filtered = [SearchListItem(t) for t in args]
+        self._children = [SearchListItem(t, self._on_item_renamed) for t in args]
+        self._filtered = self._children
+        # Searches stop after max_hits matches; load_more() resumes the scan from where it stopped
+        self._max_hits = max_hits
+        self._pending_hits = None
+        self._has_more = False
+        self._last_needle = None
+        self._last_text = ""
+        self._filter_handle = None
+
+    def _on_item_renamed(self, item):
+        # A renamed item may now match a query it did not match before, so the next search has to scan every item
+        # again instead of narrowing the previous results, even if the search text did not change
+        self._last_needle = None
+        self._last_text = None
 
     def get_item_children(self, item):
         """Returns all the children when the widget asks it."""
@@ -1534,12 +1576,27 @@ class SearchListItemModel(ui.AbstractItemModel):
         return self._filtered
 
     def filter_text(self, text):
-        import fnmatch
-
+        """Schedules the list to be filtered by `text`, coalescing bursts of keystrokes into one pass"""
+        if self._filter_handle is not None:
+            self._filter_handle.cancel()
+            self._filter_handle = None
+        if text == self._last_text:
+            return
+        self._filter_handle = asyncio.get_event_loop().call_later(self.FILTER_DELAY, self._do_filter, text)
+
+    def _do_filter(self, text):
+        self._filter_handle = None
+        self._last_text = text
+        last_needle = self._last_needle
+        previous = self._filtered
+        previous_complete = not self._has_more
+        self._last_needle = None
+        self._pending_hits = None
+        self._has_more = False
         self._filtered = []
         if len(text) == 0:
-            for c in self._children:
-                self._filtered.append(c)
+            # _filtered is only ever rebound, never mutated in place, so it can share the full list
+            self._filtered = self._children
         else:
             parts = text.split()
             # for i in range(len(parts) - 1, -1, -1):
@@ -1547,14 +1604,40 @@ class SearchListItemModel(ui.AbstractItemModel):
 
             leftover = " ".join(parts)
             if len(leftover) > 0:
-                filter_str = f"*{leftover.lower()}*"
-                for c in self._children:
-                    if fnmatch.fnmatch(c.name().lower(), filter_str):
-                        self._filtered.append(c)
+                needle = leftover.lower()
+                # Anything matching a longer query also matched the one it extends, so only rescan those
+                narrow = previous_complete and last_needle is not None and last_needle in needle
+                candidates = previous if narrow else self._children
+                self._pending_hits = (c for c in candidates if needle in c.lower_name)
+                self._filtered = self._take_hits()
+                self._last_needle = needle
+
+        # The single root notification is what rebuilds every row, so skip it when the rows are unchanged
+        if self._filtered is previous or self._filtered == previous:
+            return
 
         # This tells the Delegate to update the TreeView
         self._item_changed(None)
 
+    def _take_hits(self):
+        # Read one match past the batch so that exactly max_hits matches does not leave a phantom "more"
+        hits = list(itertools.islice(self._pending_hits, self._max_hits + 1))
+        self._has_more = len(hits) > self._max_hits
+        if self._has_more:
+            self._pending_hits = itertools.chain((hits.pop(),), self._pending_hits)
+        else:
+            self._pending_hits = None
+        return hits
+
+    def load_more(self):
+        """Appends the next batch of matches for the current search, if the last one was cut short"""
+        if not self._has_more:
+            return
+        more = self._take_hits()
+        if more:
+            self._filtered = self._filtered + more
+            self._item_changed(None)
+
     def get_item_value_model_count(self, item):
         """The number of columns"""
         return 1
@@ -1576,7 +1659,7 @@ class SearchListItemDelegate(ui.AbstractItemDelegate):
 
     def __init__(self, on_double_click_fn=None):
         super().__init__()
-        self._on_double_click_fn = on_double_click_fn
+        self._on_double_click_fn = on_double_click_fn or self.on_double_click
 
     def build_branch(self, model, item, column_id, level, expanded):
         """Create a branch widget that opens or closes subtree"""
@@ -1584,18 +1667,17 @@ class SearchListItemDelegate(ui.AbstractItemDelegate):
 
     def build_widget(self, model, item, column_id, level, expanded):
         """Create a widget per column per item"""
-        stack = ui.ZStack(height=20, style=get_style())
+        stack = ui.ZStack(height=20)
         with stack:
             with ui.HStack():
                 ui.Spacer(width=5)
-                value_model = model.get_item_value_model(item, column_id)
-                label = ui.Label(value_model.as_string, name="TreeView.Item")
-
-        if not self._on_double_click_fn:
-            self._on_double_click_fn = self.on_double_click
+                label = ui.Label(item.name_model.as_string, name="TreeView.Item")
 
         # Set a double click function
-        stack.set_mouse_double_clicked_fn(lambda x, y, b, m, l=label: self._on_double_click_fn(b, m, l))
+        stack.set_mouse_double_clicked_fn(functools.partial(self._dispatch_double_click, label))
+
+    def _dispatch_double_click(self, label, x, y, button, modifier):
+        self._on_double_click_fn(button, modifier, label)
 
     def on_double_click(self, button, model, label):
         """Called when the user double-clicked the item in TreeView"""
@@ -1619,25 +1701,33 @@ def build_simple_search(label="", type="search", model=None, delegate=None, tool
         Tuple(Search Widget, Treeview):
     """
 
+    tt = format_tt(tooltip)
     with ui.HStack():
-        ui.Label(label, width=LABEL_WIDTH, alignment=ui.Alignment.LEFT_TOP, tooltip=format_tt(tooltip))
+        _label(label, tt, align=_ALIGN_LT)
 
         with ui.VStack(spacing=5):
 
             def filter_text(item):
                 model.filter_text(item)
 
-            from omni.kit.window.extensions.ext_components import SearchWidget
-
             search_bar = SearchWidget(filter_text)
 
-            with ui.ScrollingFrame(
+            scrolling_frame = ui.ScrollingFrame(
                 height=LABEL_HEIGHT * 5,
-                horizontal_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_ALWAYS_OFF,
-                vertical_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_ALWAYS_ON,
-                style=get_style(),
+                horizontal_scrollbar_policy=_SBAR_ALWAYS_OFF,
+                vertical_scrollbar_policy=_SBAR_ALWAYS_ON,
+                style=_STYLE,
                 style_type_name_override="TreeView.ScrollingFrame",
-            ):
+            )
+            if isinstance(model, SearchListItemModel):
+
+                def on_scroll_y_changed(y, _frame=scrolling_frame, _model=model):
+                    # Fetch the next batch of matches once the user scrolls to the bottom
+                    if y >= _frame.scroll_y_max:
+                        _model.load_more()
+
+                scrolling_frame.set_scroll_y_changed_fn(on_scroll_y_changed)
+            with scrolling_frame:
                 treeview = ui.TreeView(
                     model,
                     delegate=delegate,
@@ -14,3 +14,4 @@
 # limitations under the License.
 
 from .test_urdf import *
+from .test_ui_utils import *
@@ -0,0 +1,151 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# NOTE:
+#   omni.kit.test - std python's unittest module with additional wrapping to add suport for async/await tests
+#   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
+import omni.kit.app
+import omni.kit.test
+import omni.ui as ui
+from omni.importer.urdf.scripts.ui import ui_utils
+from omni.importer.urdf.scripts.ui.ui_utils import SearchListItemModel
+
+
+# Tests for the search list model, driving _do_filter and load_more directly instead of waiting on the filter delay
+class TestSearchListItemModel(omni.kit.test.AsyncTestCase):
+    # Build a model and record every root notification it sends
+    def _make_model(self, names, max_hits=200):
+        model = SearchListItemModel(*names, max_hits=max_hits)
+        self._changes = []
+        model.add_item_changed_fn(lambda m, item: self._changes.append(item))
+        return model
+
+    def _rows(self, model):
+        return [item.name() for item in model.get_item_children(None)]
+
+    async def test_filter_and_clear(self):
+        model = self._make_model(["Alpha", "Beta", "Alphabet", "Gamma"])
+
+        model._do_filter("alp")
+        self.assertEqual(self._rows(model), ["Alpha", "Alphabet"])
+        self.assertEqual(len(self._changes), 1)
+
+        # A different text with the same matches does not rebuild the rows
+        model._do_filter("ALP ")
+        self.assertEqual(self._rows(model), ["Alpha", "Alphabet"])
+        self.assertEqual(len(self._changes), 1)
+
+        model._do_filter("")
+        self.assertEqual(self._rows(model), ["Alpha", "Beta", "Alphabet", "Gamma"])
+        self.assertEqual(len(self._changes), 2)
+
+        # Clearing an already clear query is not a change either
+        model._do_filter("")
+        self.assertEqual(len(self._changes), 2)
+
+    async def test_exactly_max_hits(self):
+        model = self._make_model(["link_1", "link_2", "base"], max_hits=2)
+
+        model._do_filter("link")
+        self.assertEqual(self._rows(model), ["link_1", "link_2"])
+        self.assertFalse(model._has_more)
+
+        model.load_more()
+        self.assertEqual(self._rows(model), ["link_1", "link_2"])
+        self.assertEqual(len(self._changes), 1)
+
+    async def test_load_more(self):
+        model = self._make_model(["link_1", "link_2", "link_3", "link_4", "link_5", "base"], max_hits=2)
+
+        model._do_filter("link")
+        self.assertEqual(self._rows(model), ["link_1", "link_2"])
+        self.assertTrue(model._has_more)
+
+        model.load_more()
+        self.assertEqual(self._rows(model), ["link_1", "link_2", "link_3", "link_4"])
+        self.assertTrue(model._has_more)
+
+        model.load_more()
+        self.assertEqual(self._rows(model), ["link_1", "link_2", "link_3", "link_4", "link_5"])
+        self.assertFalse(model._has_more)
+        self.assertEqual(len(self._changes), 3)
+
+        # Once the matches are exhausted there is nothing left to load
+        model.load_more()
+        self.assertEqual(len(self._changes), 3)
+
+    async def test_narrow_after_capped_result(self):
+        model = self._make_model(["link_1", "link_2", "x_link_3"], max_hits=2)
+
+        model._do_filter("link")
+        self.assertEqual(self._rows(model), ["link_1", "link_2"])
+
+        # The capped result does not hold every match of "link", so the extended query has to scan everything
+        model._do_filter("link_3")
+        self.assertEqual(self._rows(model), ["x_link_3"])
+
+    async def test_narrow_after_complete_result(self):
+        model = self._make_model(["link_1", "link_2", "base"])
+
+        model._do_filter("link")
+        model._do_filter("link_2")
+        self.assertEqual(self._rows(model), ["link_2"])
+        self.assertEqual(len(self._changes), 2)
+
+    async def test_rename_after_search(self):
+        model = self._make_model(["base", "arm"])
+
+        model._do_filter("ar")
+        self.assertEqual(self._rows(model), ["arm"])
+
+        # A rename into a match must not be lost to narrowing the previous results
+        model._children[0].name_model.set_value("barn")
+        model._do_filter("arn")
+        self.assertEqual(self._rows(model), ["barn"])
+
+
+class TestThrottler(omni.kit.test.AsyncTestCase):
+    async def _wait_updates(self, count):
+        for _ in range(count):
+            await omni.kit.app.get_app().next_update_async()
+
+    async def test_coalesces_to_last_value(self):
+        calls = []
+        model = ui_utils._Throttler(lambda m: calls.append(m.as_float)).attach(ui.SimpleFloatModel(0.0))
+
+        model.set_value(1.0)
+        model.set_value(2.0)
+        model.set_value(3.0)
+        # Nothing is dispatched inside the value change itself
+        self.assertEqual(calls, [])
+
+        await self._wait_updates(2)
+        self.assertEqual(calls, [3.0])
+
+    async def test_subscription_dropped_when_idle(self):
+        calls = []
+        model = ui_utils._Throttler(lambda m: calls.append(m.as_float)).attach(ui.SimpleFloatModel(0.0))
+
+        model.set_value(1.0)
+        self.assertIsNotNone(ui_utils._throttle_sub)
+        await self._wait_updates(ui_utils._THROTTLE_IDLE_UPDATES + 2)
+        self.assertEqual(calls, [1.0])
+        self.assertIsNone(ui_utils._throttle_sub)
+
+        # The next change subscribes again
+        model.set_value(4.0)
+        self.assertIsNotNone(ui_utils._throttle_sub)
+        await self._wait_updates(2)
+        self.assertEqual(calls, [1.0, 4.0])
@@ -13,11 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import asyncio
 import json
 import os
 
-import numpy as np
 import omni.kit.commands
 
 # NOTE:
@@ -25,20 +23,69 @@ import omni.kit.commands
 #   For most things refer to unittest docs: https://docs.python.org/3/library/unittest.html
 import omni.kit.test
 import pxr
-from pxr import Gf, PhysicsSchemaTools, PhysxSchema, Sdf, UsdGeom, UsdPhysics, UsdShade
+from omni.importer.urdf import _urdf
+from pxr import Gf, PhysicsSchemaTools, PhysxSchema, Sdf, Usd, UsdGeom, UsdPhysics, UsdShade
+
+
+# URDF files used by the tests, relative to the extension root
+_URDF_FILES = {
+    "names": "data/urdf/tests/test_names.urdf",
+    "basic": "data/urdf/tests/test_basic.urdf",
+    "sensor": "data/urdf/tests/test_sensor.urdf",
+    "massless": "data/urdf/tests/test_massless.urdf",
+    "advanced": "data/urdf/tests/test_advanced.urdf",
+    "merge_joints": "data/urdf/tests/test_merge_joints.urdf",
+    "mtl": "data/urdf/tests/test_mtl.urdf",
+    "material": "data/urdf/tests/test_material.urdf",
+    "mtl_stl": "data/urdf/tests/test_mtl_stl.urdf",
+    "carter": "data/urdf/robots/carter/urdf/carter.urdf",
+    "cobotta_pro_900": "data/urdf/robots/cobotta_pro_900/cobotta_pro_900.urdf",
+    "panda_arm_hand": "data/urdf/robots/franka_description/robots/panda_arm_hand.urdf",
+    "ur10": "data/urdf/robots/ur10/urdf/ur10.urdf",
+    "kaya": "data/urdf/robots/kaya/urdf/kaya.urdf",
+    "missing": "data/urdf/tests/test_missing.urdf",
+    "large": "data/urdf/tests/test_large.urdf",
+    "floating": "data/urdf/tests/test_floating.urdf",
+    "usd": "data/urdf/tests/test_usd.urdf",
+    "limits": "data/urdf/tests/test_limits.urdf",
+    "collision_from_visuals": "data/urdf/tests/test_collision_from_visuals.urdf",
+}
+
+# Set URDF_TEST_RUN_SIM=0 to skip the "nothing crashes" simulation steps and only check the import results
+_RUN_SIM = os.getenv("URDF_TEST_RUN_SIM", "1") == "1"
+
+
+# Mark a test that only imports to a dest_path and inspects the saved file, so setUp leaves the open stage alone
+def _file_only(test):
+    test.file_only = True
+    return test
+
+
+# Read several attributes of one prim through cached attribute queries, keyed by attribute name
+def _get_attrs(prim, names):
+    queries = [Usd.AttributeQuery(prim.GetAttribute(name)) for name in names]
+    return {name: query.Get() for name, query in zip(names, queries)}
 
 
 # Having a test class dervived from omni.kit.test.AsyncTestCase declared on the root of module will make it auto-discoverable by omni.kit.test
 class TestUrdf(omni.kit.test.AsyncTestCase):
-    # Before running each test
-    async def setUp(self):
-        self._timeline = omni.timeline.get_timeline_interface()
-
+    # Before running any test: resolve the extension paths and the timeline once for the whole class
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._timeline = omni.timeline.get_timeline_interface()
         ext_manager = omni.kit.app.get_app().get_extension_manager()
         ext_id = ext_manager.get_enabled_extension_id("omni.importer.urdf")
-        self._extension_path = ext_manager.get_extension_path(ext_id)
-        self.dest_path = os.path.abspath(self._extension_path + "/tests_out")
-        await omni.usd.get_context().new_stage_async()
+        cls._extension_path = ext_manager.get_extension_path(ext_id)
+        cls.dest_path = os.path.abspath(cls._extension_path + "/tests_out")
+        cls._urdfs = {
+            name: os.path.abspath(os.path.join(cls._extension_path, rel)) for name, rel in _URDF_FILES.items()
+        }
+
+    # Before running each test
+    async def setUp(self):
+        if not getattr(getattr(self, self._testMethodName), "file_only", False):
+            await omni.usd.get_context().new_stage_async()
         await omni.kit.app.get_app().next_update_async()
         pass
 
@@ -48,30 +95,36 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
         await omni.kit.app.get_app().next_update_async()
         pass
 
-    # Tests to make sure visual mesh names are incremented
-    async def test_urdf_mesh_naming(self):
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_names.urdf")
-        stage = omni.usd.get_context().get_stage()
-
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
-        import_config.merge_fixed_joints = True
-        omni.kit.commands.execute("URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config)
-        prim = stage.GetPrimAtPath("/test_names/cube/visuals")
-        prim_range = prim.GetChildren()
-        # There should be a total of 6 visual meshes after import
-        self.assertEqual(len(prim_range), 6)
-
-    # basic urdf test: joints and links are imported correctly
-    async def test_urdf_basic(self):
-
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_basic.urdf")
-        stage = omni.usd.get_context().get_stage()
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+    # Advance the app by a fixed number of frames, e.g. to let a playing simulation step
+    async def _tick(self, n=10):
+        for _ in range(n):
+            await omni.kit.app.get_app().next_update_async()
 
-        import_config.import_inertia_tensor = True
-        omni.kit.commands.execute("URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config)
-        await omni.kit.app.get_app().next_update_async()
+    # Play the timeline for a few frames and stop it again, unless simulation is disabled for this run
+    async def _simulate(self, n=10):
+        if not _RUN_SIM:
+            return
+        self._timeline.play()
+        await self._tick(n)
+        self._timeline.stop()
 
+    # Walk the robot once and check that each of the given collision prims exists, has the collision API applied
+    # and has collision enabled
+    def _assert_collision(self, root_prim, paths):
+        expected = {path: (True, True) for path in paths}
+        results = {}
+        for prim in Usd.PrimRange(root_prim):
+            path = prim.GetPath()
+            if path in expected:
+                collision_api = UsdPhysics.CollisionAPI(prim)
+                results[path] = (
+                    prim.HasAPI(UsdPhysics.CollisionAPI),
+                    bool(collision_api.GetCollisionEnabledAttr().Get()),
+                )
+        self.assertEqual(results, expected)
+
+    # Checks shared by every test that imports test_basic.urdf, whether on the open stage or from a saved file
+    def _assert_basic_urdf(self, stage):
         prim = stage.GetPrimAtPath("/test_basic")
         self.assertNotEqual(prim.GetPath(), Sdf.Path.emptyPath)
 
@@ -89,32 +142,53 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
         self.assertAlmostEqual(fingerJoint.GetAttribute("physics:upperLimit").Get(), 0.08)
 
         fingerLink = stage.GetPrimAtPath("/test_basic/finger_link_2")
-        self.assertAlmostEqual(fingerLink.GetAttribute("physics:diagonalInertia").Get()[0], 2.0)
-        self.assertAlmostEqual(fingerLink.GetAttribute("physics:mass").Get(), 3)
+        attrs = _get_attrs(fingerLink, ["physics:diagonalInertia", "physics:mass"])
+        self.assertAlmostEqual(attrs["physics:diagonalInertia"][0], 2.0)
+        self.assertAlmostEqual(attrs["physics:mass"], 3)
 
-        fingerLink3 = stage.GetPrimAtPath("/test_basic/finger_link_3")
-        self.assertAlmostEqual(fingerLink3.GetAttribute("physics:diagonalInertia").Get()[0], 0.001002)
-        print(
-            fingerLink3.GetAttribute("physics:principalAxes").Get().GetReal(),
-            fingerLink3.GetAttribute("physics:principalAxes").Get().GetImaginary(),
-        )
-        self.assertAlmostEqual(fingerLink3.GetAttribute("physics:principalAxes").Get().GetReal(), 0.88047838211059)
+        self.assertAlmostEqual(UsdGeom.GetStageMetersPerUnit(stage), 1.0)
 
-        # Start Simulation and wait
-        self._timeline.play()
+    # Tests to make sure visual mesh names are incremented
+    async def test_urdf_mesh_naming(self):
+        urdf_path = self._urdfs["names"]
+        stage = omni.usd.get_context().get_stage()
+
+        import_config = _urdf.ImportConfig()
+        import_config.merge_fixed_joints = True
+        omni.kit.commands.execute("URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config)
+        prim = stage.GetPrimAtPath("/test_names/cube/visuals")
+        prim_range = prim.GetChildren()
+        # There should be a total of 6 visual meshes after import
+        self.assertEqual(len(prim_range), 6)
+
+    # basic urdf test: joints and links are imported correctly
+    async def test_urdf_basic(self):
+
+        urdf_path = self._urdfs["basic"]
+        stage = omni.usd.get_context().get_stage()
+        import_config = _urdf.ImportConfig()
+
+        import_config.import_inertia_tensor = True
+        omni.kit.commands.execute("URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config)
         await omni.kit.app.get_app().next_update_async()
-        await asyncio.sleep(1.0)
-        # nothing crashes
-        self._timeline.stop()
 
-        self.assertAlmostEqual(UsdGeom.GetStageMetersPerUnit(stage), 1.0)
+        self._assert_basic_urdf(stage)
+
+        fingerLink3 = stage.GetPrimAtPath("/test_basic/finger_link_3")
+        attrs = _get_attrs(fingerLink3, ["physics:diagonalInertia", "physics:principalAxes"])
+        self.assertAlmostEqual(attrs["physics:diagonalInertia"][0], 0.001002)
+        self.assertAlmostEqual(attrs["physics:principalAxes"].GetReal(), 0.88047838211059)
+
+        # Start Simulation and wait, nothing should crash
+        await self._simulate()
         pass
 
+    @_file_only
     async def test_urdf_sensors(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_sensor.urdf")
+        urdf_path = self._urdfs["sensor"]
         dest_path = os.path.abspath(self.dest_path + "/test_sensor.usd")
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        import_config = _urdf.ImportConfig()
 
         import_config.import_inertia_tensor = True
         omni.kit.commands.execute(
@@ -122,7 +196,6 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
         )
         await omni.kit.app.get_app().next_update_async()
         stage = pxr.Usd.Stage.Open(dest_path)
-        await omni.kit.app.get_app().next_update_async()
 
         camera_prim = stage.GetPrimAtPath("/test_sensor/link_1/camera")
 
@@ -148,9 +221,9 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
 
     async def test_urdf_massless(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_massless.urdf")
+        urdf_path = self._urdfs["massless"]
         stage = omni.usd.get_context().get_stage()
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        import_config = _urdf.ImportConfig()
 
         import_config.import_inertia_tensor = True
         import_config.merge_fixed_joints = False
@@ -164,27 +237,29 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
         self.assertEqual(rootLink.GetAttribute("physics:mass").Get(), 0)
 
         no_mass_no_collision_no_inertia = stage.GetPrimAtPath("/test_massless/no_mass_no_collision_no_inertia")
-        self.assertAlmostEqual(
-            no_mass_no_collision_no_inertia.GetAttribute("physics:diagonalInertia").Get()[0], 0.00001
-        )
-        self.assertAlmostEqual(no_mass_no_collision_no_inertia.GetAttribute("physics:mass").Get(), 0.000001)
+        attrs = _get_attrs(no_mass_no_collision_no_inertia, ["physics:diagonalInertia", "physics:mass"])
+        self.assertAlmostEqual(attrs["physics:diagonalInertia"][0], 0.00001)
+        self.assertAlmostEqual(attrs["physics:mass"], 0.000001)
 
         mass_no_collision_no_inertia = stage.GetPrimAtPath("/test_massless/mass_no_collision_no_inertia")
-        self.assertAlmostEqual(mass_no_collision_no_inertia.GetAttribute("physics:diagonalInertia").Get()[0], 0.00001)
-        self.assertAlmostEqual(mass_no_collision_no_inertia.GetAttribute("physics:mass").Get(), 10.0)
+        attrs = _get_attrs(mass_no_collision_no_inertia, ["physics:diagonalInertia", "physics:mass"])
+        self.assertAlmostEqual(attrs["physics:diagonalInertia"][0], 0.00001)
+        self.assertAlmostEqual(attrs["physics:mass"], 10.0)
 
         mass_collision_no_inertia = stage.GetPrimAtPath("/test_massless/mass_collision_no_inertia")
-        self.assertAlmostEqual(mass_collision_no_inertia.GetAttribute("physics:diagonalInertia").Get()[0], 0.0)
-        self.assertAlmostEqual(mass_collision_no_inertia.GetAttribute("physics:mass").Get(), 10.0)
+        attrs = _get_attrs(mass_collision_no_inertia, ["physics:diagonalInertia", "physics:mass"])
+        self.assertAlmostEqual(attrs["physics:diagonalInertia"][0], 0.0)
+        self.assertAlmostEqual(attrs["physics:mass"], 10.0)
 
         self.assertAlmostEqual(UsdGeom.GetStageMetersPerUnit(stage), 1.0)
         pass
 
+    @_file_only
     async def test_urdf_save_to_file(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_basic.urdf")
+        urdf_path = self._urdfs["basic"]
         dest_path = os.path.abspath(self.dest_path + "/test_basic.usd")
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        import_config = _urdf.ImportConfig()
 
         import_config.import_inertia_tensor = True
         omni.kit.commands.execute(
@@ -192,59 +267,40 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
         )
         await omni.kit.app.get_app().next_update_async()
         stage = pxr.Usd.Stage.Open(dest_path)
-        prim = stage.GetPrimAtPath("/test_basic")
-        self.assertNotEqual(prim.GetPath(), Sdf.Path.emptyPath)
-
-        # make sure the joints exist
-        root_joint = stage.GetPrimAtPath("/test_basic/root_joint")
-        self.assertNotEqual(root_joint.GetPath(), Sdf.Path.emptyPath)
-
-        wristJoint = stage.GetPrimAtPath("/test_basic/link_2/wrist_joint")
-        self.assertNotEqual(wristJoint.GetPath(), Sdf.Path.emptyPath)
-        self.assertEqual(wristJoint.GetTypeName(), "PhysicsRevoluteJoint")
-
-        fingerJoint = stage.GetPrimAtPath("/test_basic/palm_link/finger_1_joint")
-        self.assertNotEqual(fingerJoint.GetPath(), Sdf.Path.emptyPath)
-        self.assertEqual(fingerJoint.GetTypeName(), "PhysicsPrismaticJoint")
-        self.assertAlmostEqual(fingerJoint.GetAttribute("physics:upperLimit").Get(), 0.08)
-
-        fingerLink = stage.GetPrimAtPath("/test_basic/finger_link_2")
-        self.assertAlmostEqual(fingerLink.GetAttribute("physics:diagonalInertia").Get()[0], 2.0)
-        self.assertAlmostEqual(fingerLink.GetAttribute("physics:mass").Get(), 3)
-
-        self.assertAlmostEqual(UsdGeom.GetStageMetersPerUnit(stage), 1.0)
+        self._assert_basic_urdf(stage)
         stage = None
         pass
 
+    @_file_only
     async def test_urdf_save_twice_to_file(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_basic.urdf")
+        urdf_path = self._urdfs["basic"]
         dest_path = os.path.abspath(self.dest_path + "/test_basic.usd")
         await self.test_urdf_save_to_file()
-        await omni.kit.app.get_app().next_update_async()
         stats = os.stat(dest_path)
         await self.test_urdf_save_to_file()
         stats_2 = os.stat(dest_path)
-        await omni.kit.app.get_app().next_update_async()
         pass
 
+    @_file_only
     async def test_urdf_textured_obj(self):
 
         base_path = self._extension_path + "/data/urdf/tests/test_textures_urdf"
         basename = "cube_obj"
         dest_path = "{}/{}/{}.usd".format(self.dest_path, basename, basename)
         mats_path = "{}/{}/materials".format(self.dest_path, basename)
-        omni.client.create_folder("{}/{}".format(self.dest_path, basename))
-        omni.client.create_folder(mats_path)
+        # The materials folder is created inside the robot folder, so the two calls can't run concurrently
+        await omni.client.create_folder_async("{}/{}".format(self.dest_path, basename))
+        await omni.client.create_folder_async(mats_path)
 
         urdf_path = "{}/{}.urdf".format(base_path, basename)
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        import_config = _urdf.ImportConfig()
 
         omni.kit.commands.execute(
             "URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config, dest_path=dest_path
         )
         await omni.kit.app.get_app().next_update_async()
-        result = omni.client.list(mats_path)
+        result = await omni.client.list_async(mats_path)
         self.assertEqual(result[0], omni.client._omniclient.Result.OK)
         self.assertEqual(len(result[1]), 4)  # Metallic texture is unsuported by assimp on OBJ
         pass
@@ -255,88 +311,66 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
         basename = "cube_obj"
 
         urdf_path = "{}/{}.urdf".format(base_path, basename)
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        import_config = _urdf.ImportConfig()
 
         omni.kit.commands.execute("URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config)
         await omni.kit.app.get_app().next_update_async()
         pass
 
+    @_file_only
     async def test_urdf_textured_dae(self):
 
         base_path = self._extension_path + "/data/urdf/tests/test_textures_urdf"
         basename = "cube_dae"
         dest_path = "{}/{}/{}.usd".format(self.dest_path, basename, basename)
         mats_path = "{}/{}/materials".format(self.dest_path, basename)
-        omni.client.create_folder("{}/{}".format(self.dest_path, basename))
-        omni.client.create_folder(mats_path)
+        # The materials folder is created inside the robot folder, so the two calls can't run concurrently
+        await omni.client.create_folder_async("{}/{}".format(self.dest_path, basename))
+        await omni.client.create_folder_async(mats_path)
 
         urdf_path = "{}/{}.urdf".format(base_path, basename)
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        import_config = _urdf.ImportConfig()
 
         omni.kit.commands.execute(
             "URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config, dest_path=dest_path
         )
         await omni.kit.app.get_app().next_update_async()
-        result = omni.client.list(mats_path)
+        result = await omni.client.list_async(mats_path)
         self.assertEqual(result[0], omni.client._omniclient.Result.OK)
         self.assertEqual(len(result[1]), 1)  # only albedo is supported for Collada
         pass
 
     async def test_urdf_overwrite_file(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_basic.urdf")
+        urdf_path = self._urdfs["basic"]
         dest_path = os.path.abspath(self._extension_path + "/data/urdf/tests/tests_out/test_basic.usd")
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        import_config = _urdf.ImportConfig()
 
         import_config.import_inertia_tensor = True
         omni.kit.commands.execute(
             "URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config, dest_path=dest_path
         )
-        await omni.kit.app.get_app().next_update_async()
         omni.kit.commands.execute(
             "URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config, dest_path=dest_path
         )
         await omni.kit.app.get_app().next_update_async()
 
         stage = pxr.Usd.Stage.Open(dest_path)
-        prim = stage.GetPrimAtPath("/test_basic")
-        self.assertNotEqual(prim.GetPath(), Sdf.Path.emptyPath)
+        self._assert_basic_urdf(stage)
 
-        # make sure the joints exist
-        root_joint = stage.GetPrimAtPath("/test_basic/root_joint")
-        self.assertNotEqual(root_joint.GetPath(), Sdf.Path.emptyPath)
-
-        wristJoint = stage.GetPrimAtPath("/test_basic/link_2/wrist_joint")
-        self.assertNotEqual(wristJoint.GetPath(), Sdf.Path.emptyPath)
-        self.assertEqual(wristJoint.GetTypeName(), "PhysicsRevoluteJoint")
-
-        fingerJoint = stage.GetPrimAtPath("/test_basic/palm_link/finger_1_joint")
-        self.assertNotEqual(fingerJoint.GetPath(), Sdf.Path.emptyPath)
-        self.assertEqual(fingerJoint.GetTypeName(), "PhysicsPrismaticJoint")
-        self.assertAlmostEqual(fingerJoint.GetAttribute("physics:upperLimit").Get(), 0.08)
-
-        fingerLink = stage.GetPrimAtPath("/test_basic/finger_link_2")
-        self.assertAlmostEqual(fingerLink.GetAttribute("physics:diagonalInertia").Get()[0], 2.0)
-        self.assertAlmostEqual(fingerLink.GetAttribute("physics:mass").Get(), 3)
-
-        # Start Simulation and wait
-        self._timeline.play()
-        await omni.kit.app.get_app().next_update_async()
-        await asyncio.sleep(1.0)
-        # nothing crashes
-        self._timeline.stop()
-        self.assertAlmostEqual(UsdGeom.GetStageMetersPerUnit(stage), 1.0)
+        # Start Simulation and wait, nothing should crash
+        await self._simulate()
         stage = None
         pass
 
     # advanced urdf test: test for all the categories of inputs that an urdf can hold
     async def test_urdf_advanced(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_advanced.urdf")
+        urdf_path = self._urdfs["advanced"]
         stage = omni.usd.get_context().get_stage()
 
         # enable merging fixed joints
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        import_config = _urdf.ImportConfig()
         import_config.merge_fixed_joints = True
         import_config.default_position_drive_damping = -1  # ignore this setting by making it -1
         omni.kit.commands.execute("URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config)
@@ -350,36 +384,34 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
         mesh = stage.GetPrimAtPath("/test_advanced/link_1/visuals")
         self.assertNotEqual(mesh.GetPath(), Sdf.Path.emptyPath)
         mat, rel = UsdShade.MaterialBindingAPI(mesh).ComputeBoundMaterial()
-        shader = UsdShade.Shader(stage.GetPrimAtPath(mat.GetPath().pathString + "/Shader"))
+        shader = UsdShade.Shader(mat.GetPrim().GetChild("Shader"))
         self.assertTrue(Gf.IsClose(shader.GetInput("diffuse_color_constant").Get(), Gf.Vec3f(0, 0.8, 0), 1e-5))
 
         # check joint properties
         elbowPrim = stage.GetPrimAtPath("/test_advanced/link_1/elbow_joint")
         self.assertNotEqual(elbowPrim.GetPath(), Sdf.Path.emptyPath)
-        self.assertAlmostEqual(elbowPrim.GetAttribute("physxJoint:jointFriction").Get(), 0.1)
-        self.assertAlmostEqual(elbowPrim.GetAttribute("drive:angular:physics:damping").Get(), 0.1)
+        attrs = _get_attrs(
+            elbowPrim, ["physxJoint:jointFriction", "drive:angular:physics:damping", "physics:localPos0"]
+        )
+        self.assertAlmostEqual(attrs["physxJoint:jointFriction"], 0.1)
+        self.assertAlmostEqual(attrs["drive:angular:physics:damping"], 0.1)
 
         # check position of a link
-        joint_pos = elbowPrim.GetAttribute("physics:localPos0").Get()
-        self.assertTrue(Gf.IsClose(joint_pos, Gf.Vec3f(0, 0, 0.40), 1e-5))
+        self.assertTrue(Gf.IsClose(attrs["physics:localPos0"], Gf.Vec3f(0, 0, 0.40), 1e-5))
 
-        # Start Simulation and wait
-        self._timeline.play()
-        await omni.kit.app.get_app().next_update_async()
-        await asyncio.sleep(1.0)
-        # nothing crashes
-        self._timeline.stop()
+        # Start Simulation and wait, nothing should crash
+        await self._simulate()
         pass
 
     # test for importing urdf where fixed joints are merged
     async def test_urdf_merge_joints(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_merge_joints.urdf")
+        urdf_path = self._urdfs["merge_joints"]
 
         stage = omni.usd.get_context().get_stage()
 
         # enable merging fixed joints
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        import_config = _urdf.ImportConfig()
         import_config.merge_fixed_joints = True
         omni.kit.commands.execute("URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config)
 
@@ -391,67 +423,66 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
 
     async def test_urdf_mtl(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_mtl.urdf")
+        urdf_path = self._urdfs["mtl"]
 
         stage = omni.usd.get_context().get_stage()
 
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        import_config = _urdf.ImportConfig()
         omni.kit.commands.execute("URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config)
 
         mesh = stage.GetPrimAtPath("/test_mtl/cube/visuals")
         self.assertTrue(UsdShade.MaterialBindingAPI(mesh) is not None)
         mat, rel = UsdShade.MaterialBindingAPI(mesh).ComputeBoundMaterial()
-        shader = UsdShade.Shader(stage.GetPrimAtPath(mat.GetPath().pathString + "/Shader"))
-        print(shader)
+        shader = UsdShade.Shader(mat.GetPrim().GetChild("Shader"))
         self.assertTrue(Gf.IsClose(shader.GetInput("diffuse_color_constant").Get(), Gf.Vec3f(0.8, 0.0, 0), 1e-5))
 
     async def test_urdf_material(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_material.urdf")
+        urdf_path = self._urdfs["material"]
 
         stage = omni.usd.get_context().get_stage()
 
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        import_config = _urdf.ImportConfig()
         omni.kit.commands.execute("URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config)
 
         mesh = stage.GetPrimAtPath("/test_material/base/visuals")
         self.assertTrue(UsdShade.MaterialBindingAPI(mesh) is not None)
         mat, rel = UsdShade.MaterialBindingAPI(mesh).ComputeBoundMaterial()
-        shader = UsdShade.Shader(stage.GetPrimAtPath(mat.GetPath().pathString + "/Shader"))
-        print(shader)
+        shader = UsdShade.Shader(mat.GetPrim().GetChild("Shader"))
         self.assertTrue(Gf.IsClose(shader.GetInput("diffuse_color_constant").Get(), Gf.Vec3f(1.0, 0.0, 0.0), 1e-5))
 
     async def test_urdf_mtl_stl(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_mtl_stl.urdf")
+        urdf_path = self._urdfs["mtl_stl"]
 
         stage = omni.usd.get_context().get_stage()
 
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        import_config = _urdf.ImportConfig()
         omni.kit.commands.execute("URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config)
 
         mesh = stage.GetPrimAtPath("/test_mtl_stl/cube/visuals")
         self.assertTrue(UsdShade.MaterialBindingAPI(mesh) is not None)
         mat, rel = UsdShade.MaterialBindingAPI(mesh).ComputeBoundMaterial()
-        shader = UsdShade.Shader(stage.GetPrimAtPath(mat.GetPath().pathString + "/Shader"))
-        print(shader)
+        shader = UsdShade.Shader(mat.GetPrim().GetChild("Shader"))
         self.assertTrue(Gf.IsClose(shader.GetInput("diffuse_color_constant").Get(), Gf.Vec3f(0.8, 0.0, 0), 1e-5))
 
+    @_file_only
     async def test_urdf_carter(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/robots/carter/urdf/carter.urdf")
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        urdf_path = self._urdfs["carter"]
+        dest_path = os.path.abspath(self.dest_path + "/carter.usd")
+        import_config = _urdf.ImportConfig()
         import_config.merge_fixed_joints = False
         status, path = omni.kit.commands.execute(
-            "URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config
+            "URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config, dest_path=dest_path
         )
         self.assertTrue(path, "/carter")
         # TODO add checks here
 
     async def test_urdf_parse_mimic(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/robots/cobotta_pro_900/cobotta_pro_900.urdf")
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        urdf_path = self._urdfs["cobotta_pro_900"]
+        import_config = _urdf.ImportConfig()
         import_config.parse_mimic = True
         status, path = omni.kit.commands.execute(
             "URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config
@@ -470,8 +501,8 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
 
     async def test_urdf_ignore_parse_mimic(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/robots/cobotta_pro_900/cobotta_pro_900.urdf")
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        urdf_path = self._urdfs["cobotta_pro_900"]
+        import_config = _urdf.ImportConfig()
         import_config.parse_mimic = False
         status, path = omni.kit.commands.execute(
             "URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config
@@ -483,35 +514,45 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
 
         self.assertFalse(joint.HasAPI(PhysxSchema.PhysxMimicJointAPI))
 
+    @_file_only
     async def test_urdf_franka(self):
 
-        urdf_path = os.path.abspath(
-            self._extension_path + "/data/urdf/robots/franka_description/robots/panda_arm_hand.urdf"
+        urdf_path = self._urdfs["panda_arm_hand"]
+        dest_path = os.path.abspath(self.dest_path + "/panda_arm_hand.usd")
+        import_config = _urdf.ImportConfig()
+        omni.kit.commands.execute(
+            "URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config, dest_path=dest_path
         )
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
-        omni.kit.commands.execute("URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config)
         # TODO add checks here'
 
+    @_file_only
     async def test_urdf_ur10(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/robots/ur10/urdf/ur10.urdf")
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
-        omni.kit.commands.execute("URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config)
+        urdf_path = self._urdfs["ur10"]
+        dest_path = os.path.abspath(self.dest_path + "/ur10.usd")
+        import_config = _urdf.ImportConfig()
+        omni.kit.commands.execute(
+            "URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config, dest_path=dest_path
+        )
         # TODO add checks here'
 
+    @_file_only
     async def test_urdf_kaya(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/robots/kaya/urdf/kaya.urdf")
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        urdf_path = self._urdfs["kaya"]
+        dest_path = os.path.abspath(self.dest_path + "/kaya.usd")
+        import_config = _urdf.ImportConfig()
         import_config.merge_fixed_joints = False
-        omni.kit.commands.execute("URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config)
+        omni.kit.commands.execute(
+            "URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config, dest_path=dest_path
+        )
         # TODO add checks here
 
     async def test_missing(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_missing.urdf")
+        urdf_path = self._urdfs["missing"]
 
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        import_config = _urdf.ImportConfig()
         omni.kit.commands.execute("URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config)
 
     # This sample corresponds to the example in the docs, keep this and the version in the docs in sync
@@ -574,8 +615,8 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
 
     # Make sure that a urdf with more than 63 links imports
     async def test_64(self):
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_large.urdf")
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        urdf_path = self._urdfs["large"]
+        import_config = _urdf.ImportConfig()
         omni.kit.commands.execute("URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config)
         stage = omni.usd.get_context().get_stage()
         prim = stage.GetPrimAtPath("/test_large")
@@ -584,9 +625,9 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
     # basic urdf test: joints and links are imported correctly
     async def test_urdf_floating(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_floating.urdf")
+        urdf_path = self._urdfs["floating"]
         stage = omni.usd.get_context().get_stage()
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        import_config = _urdf.ImportConfig()
 
         import_config.import_inertia_tensor = True
         omni.kit.commands.execute("URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config)
@@ -601,47 +642,39 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
 
         link_1 = stage.GetPrimAtPath("/test_floating/link_1")
         self.assertNotEqual(link_1.GetPath(), Sdf.Path.emptyPath)
-        link_1_trans = np.array(omni.usd.get_world_transform_matrix(link_1).ExtractTranslation())
+        link_1_trans = omni.usd.get_world_transform_matrix(link_1).ExtractTranslation()
 
-        self.assertAlmostEqual(np.linalg.norm(link_1_trans - np.array([0, 0, 0.45])), 0, delta=0.03)
+        self.assertAlmostEqual((link_1_trans - Gf.Vec3d(0, 0, 0.45)).GetLength(), 0, delta=0.03)
         floating_link = stage.GetPrimAtPath("/test_floating/floating_link")
         self.assertNotEqual(floating_link.GetPath(), Sdf.Path.emptyPath)
-        floating_link_trans = np.array(omni.usd.get_world_transform_matrix(floating_link).ExtractTranslation())
+        floating_link_trans = omni.usd.get_world_transform_matrix(floating_link).ExtractTranslation()
 
-        self.assertAlmostEqual(np.linalg.norm(floating_link_trans - np.array([0, 0, 1.450])), 0, delta=0.03)
-        # Start Simulation and wait
-        self._timeline.play()
-        await omni.kit.app.get_app().next_update_async()
-        await asyncio.sleep(1.0)
-        # nothing crashes
-        self._timeline.stop()
+        self.assertAlmostEqual((floating_link_trans - Gf.Vec3d(0, 0, 1.450)).GetLength(), 0, delta=0.03)
+        # Start Simulation and wait, nothing should crash
+        await self._simulate()
         pass
 
     async def test_urdf_scale(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_basic.urdf")
+        urdf_path = self._urdfs["basic"]
         stage = omni.usd.get_context().get_stage()
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        import_config = _urdf.ImportConfig()
 
         import_config.distance_scale = 1.0
         omni.kit.commands.execute("URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config)
         await omni.kit.app.get_app().next_update_async()
 
-        # Start Simulation and wait
-        self._timeline.play()
-        await omni.kit.app.get_app().next_update_async()
-        await asyncio.sleep(1.0)
-        # nothing crashes
-        self._timeline.stop()
+        # Start Simulation and wait, nothing should crash
+        await self._simulate()
 
         self.assertAlmostEqual(UsdGeom.GetStageMetersPerUnit(stage), 1.0)
         pass
 
     async def test_urdf_drive_none(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_basic.urdf")
+        urdf_path = self._urdfs["basic"]
         stage = omni.usd.get_context().get_stage()
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        import_config = _urdf.ImportConfig()
         from omni.importer.urdf._urdf import UrdfJointTargetType
 
         import_config.default_drive_type = UrdfJointTargetType.JOINT_DRIVE_NONE
@@ -651,20 +684,16 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
         self.assertFalse(stage.GetPrimAtPath("/test_basic/root_joint").HasAPI(UsdPhysics.DriveAPI))
         self.assertTrue(stage.GetPrimAtPath("/test_basic/link_1/elbow_joint").HasAPI(UsdPhysics.DriveAPI))
 
-        # Start Simulation and wait
-        self._timeline.play()
-        await omni.kit.app.get_app().next_update_async()
-        await asyncio.sleep(1.0)
-        # nothing crashes
-        self._timeline.stop()
+        # Start Simulation and wait, nothing should crash
+        await self._simulate()
 
         pass
 
     async def test_urdf_usd(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_usd.urdf")
+        urdf_path = self._urdfs["usd"]
         stage = omni.usd.get_context().get_stage()
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        import_config = _urdf.ImportConfig()
         from omni.importer.urdf._urdf import UrdfJointTargetType
 
         import_config.default_drive_type = UrdfJointTargetType.JOINT_DRIVE_NONE
@@ -673,21 +702,17 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
 
         self.assertNotEqual(stage.GetPrimAtPath("/test_usd/cube/visuals/mesh_0/Cylinder"), Sdf.Path.emptyPath)
         self.assertNotEqual(stage.GetPrimAtPath("/test_usd/cube/visuals/mesh_1/Torus"), Sdf.Path.emptyPath)
-        # Start Simulation and wait
-        self._timeline.play()
-        await omni.kit.app.get_app().next_update_async()
-        await asyncio.sleep(1.0)
-        # nothing crashes
-        self._timeline.stop()
+        # Start Simulation and wait, nothing should crash
+        await self._simulate()
 
         pass
 
     # test negative joint limits
     async def test_urdf_limits(self):
 
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_limits.urdf")
+        urdf_path = self._urdfs["limits"]
         stage = omni.usd.get_context().get_stage()
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        import_config = _urdf.ImportConfig()
 
         import_config.import_inertia_tensor = True
         omni.kit.commands.execute("URDFParseAndImportFile", urdf_path=urdf_path, import_config=import_config)
@@ -721,12 +746,8 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
         self.assertEqual(finger2Joint.GetTypeName(), "PhysicsPrismaticJoint")
         self.assertTrue(finger2Joint.HasAPI(UsdPhysics.DriveAPI))
 
-        # Start Simulation and wait
-        self._timeline.play()
-        await omni.kit.app.get_app().next_update_async()
-        await asyncio.sleep(1.0)
-        # nothing crashes
-        self._timeline.stop()
+        # Start Simulation and wait, nothing should crash
+        await self._simulate()
 
         pass
 
@@ -734,9 +755,9 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
     async def test_collision_from_visuals(self):
 
         # import a urdf file without collision
-        urdf_path = os.path.abspath(self._extension_path + "/data/urdf/tests/test_collision_from_visuals.urdf")
+        urdf_path = self._urdfs["collision_from_visuals"]
         stage = omni.usd.get_context().get_stage()
-        status, import_config = omni.kit.commands.execute("URDFCreateImportConfig")
+        import_config = _urdf.ImportConfig()
 
         import_config.set_collision_from_visuals(True)
 
@@ -744,44 +765,15 @@ class TestUrdf(omni.kit.test.AsyncTestCase):
         await omni.kit.app.get_app().next_update_async()
 
         # ensure the import completed.
-        prim = stage.GetPrimAtPath("/test_collision_from_visuals")
-        self.assertNotEqual(prim.GetPath(), Sdf.Path.emptyPath)
-
-        # ensure the base_link collision prim exists and has the collision API applied.
-        base_link = stage.GetPrimAtPath("/test_collision_from_visuals/base_link/collisions")
-        self.assertNotEqual(base_link.GetPath(), Sdf.Path.emptyPath)
-        self.assertTrue(base_link.GetAttribute("physics:collisionEnabled").Get())
-
-        # ensure the link_1 collision prim exists and has the collision API applied.
-        link_1 = stage.GetPrimAtPath("/test_collision_from_visuals/link_1/collisions")
-        self.assertNotEqual(link_1.GetPath(), Sdf.Path.emptyPath)
-        self.assertTrue(link_1.GetAttribute("physics:collisionEnabled").Get())
-
-        # ensure the link_2 collision prim exists and has the collision API applied.
-        link_2 = stage.GetPrimAtPath("/test_collision_from_visuals/link_2/collisions")
-        self.assertNotEqual(link_2.GetPath(), Sdf.Path.emptyPath)
-        self.assertTrue(link_2.GetAttribute("physics:collisionEnabled").Get())
+        root = Sdf.Path("/test_collision_from_visuals")
+        prim = stage.GetPrimAtPath(root)
+        self.assertTrue(prim.IsValid())
 
-        # ensure the palm_link collision prim exists and has the collision API applied.
-        palm_link = stage.GetPrimAtPath("/test_collision_from_visuals/palm_link/collisions")
-        self.assertNotEqual(palm_link.GetPath(), Sdf.Path.emptyPath)
-        self.assertTrue(palm_link.GetAttribute("physics:collisionEnabled").Get())
+        # ensure every link got a collision prim with the collision API applied.
+        names = ["base_link", "link_1", "link_2", "palm_link", "finger_link_1", "finger_link_2"]
+        self._assert_collision(prim, [root.AppendChild(name).AppendChild("collisions") for name in names])
 
-        # ensure the finger_link_1 collision prim exists and has the collision API applied.
-        finger_link_1 = stage.GetPrimAtPath("/test_collision_from_visuals/finger_link_1/collisions")
-        self.assertNotEqual(finger_link_1.GetPath(), Sdf.Path.emptyPath)
-        self.assertTrue(finger_link_1.GetAttribute("physics:collisionEnabled").Get())
-
-        # ensure the finger_link_2 collision prim exists and has the collision API applied.
-        finger_link_2 = stage.GetPrimAtPath("/test_collision_from_visuals/finger_link_2/collisions")
-        self.assertNotEqual(finger_link_2.GetPath(), Sdf.Path.emptyPath)
-        self.assertTrue(finger_link_2.GetAttribute("physics:collisionEnabled").Get())
-
-        # Start Simulation and wait
-        self._timeline.play()
-        await omni.kit.app.get_app().next_update_async()
-        await asyncio.sleep(2.0)
-        # nothing crashes
-        self._timeline.stop()
+        # Start Simulation and wait, nothing should crash
+        await self._simulate(20)
 
         pass
@@ -1,21 +1,104 @@
 import argparse
+import functools
+import hashlib
 import os
 import sys
-from typing import Callable, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
 
 import omni.repo.ci
 
+# repo_ci expands the tokens when launching
+_REPO = "${root}/repo${shell_ext}"
+
+# Hash of the extension sources and build config the last successful publish_exts --verify ran against
+_VERIFY_STAMP = "_build/.last_publish_verify"
+
+
+# Files that pick the host deps, and the hash of their contents at the last successful fetch
+_HOST_DEPS_FILES = ("repo.toml", "deps/host-deps.packman.xml")
+_HOST_DEPS_STAMP = "_build/host-deps/.last_fetch"
+
+
+def hash_files(paths: List[str]) -> str:
+    h = hashlib.blake2b()
+    for path in paths:
+        h.update(path.encode())
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                h.update(f.read())
+    return h.hexdigest()
+
+
+def read_stamp(path: str) -> str:
+    if not os.path.exists(path):
+        return ""
+    with open(path) as f:
+        return f.read().strip()
+
+
+def write_stamp(path: str, value: str):
+    with open(path, "w") as f:
+        f.write(value)
+
 
 def pull_library_from_linbuild_usr_lib64(d: str, name: str):
     # Hack to be able to link to libasan.
     # Our toolchain is using an older version of GCC that can't statically link ASAN, so we need
     # to pull the library out of docker
-    omni.repo.ci.launch(["${root}/repo${shell_ext}", "build", "--fetch", "-rd"])
-    omni.repo.ci.launch(["_build/host-deps/linbuild/linbuild.sh", "--", "cp", f"/usr/lib64/{name}", d])
+    linbuild_sh = "_build/host-deps/linbuild/linbuild.sh"
+    # Packman extracts with unreliable mtimes, so compare the contents of the deps files instead
+    deps_hash = hash_files(_HOST_DEPS_FILES)
+    if not os.path.exists(linbuild_sh) or read_stamp(_HOST_DEPS_STAMP) != deps_hash:
+        omni.repo.ci.launch([_REPO, "build", "--fetch", "-rd"])
+        write_stamp(_HOST_DEPS_STAMP, deps_hash)
+    omni.repo.ci.launch([linbuild_sh, "--", "cp", f"/usr/lib64/{name}", d])
+
+
+def list_tree(root: str) -> List[str]:
+    paths = []
+    for d, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(n for n in dirnames if n != "__pycache__")
+        paths.extend(os.path.join(d, n) for n in sorted(filenames))
+    return paths
+
+
+def hash_publish_inputs() -> str:
+    # Everything publish_exts --verify reads: the extension sources plus the repo, premake and deps config
+    config_files = ["repo.toml", "premake5.lua"] + list_tree("deps")
+    return hash_files(list_tree("source/extensions") + config_files)
+
+
+def verify_publish_exts():
+    inputs_hash = hash_publish_inputs()
+    if read_stamp(_VERIFY_STAMP) == inputs_hash:
+        print("[skip] publish_exts --verify (no changes)")
+        return
+    omni.repo.ci.launch([_REPO, "publish_exts", "--verify"])
+    write_stamp(_VERIFY_STAMP, inputs_hash)
+
+
+def run_in_order(steps: List[Callable[[], None]]):
+    for step in steps:
+        step()
+
+
+def parse_extra_args(extra_args: List[str]) -> argparse.Namespace:
+    # repo_ci owns the main arguments, options for this script are read from the extra args
+    parser = argparse.ArgumentParser(prog="build_urdf", add_help=False)
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run the post build steps one after the other instead of overlapping the ones that write to "
+        "different output directories, e.g. to read their logs without interleaving.",
+    )
+    known, _ = parser.parse_known_args(extra_args)
+    return known
 
 
 def main(args: argparse.Namespace):
     build_config = args.build_config
+    options = parse_extra_args(getattr(args, "extra_args", None) or [])
 
     extra_flags = []
     if build_config == "release":
@@ -25,28 +108,50 @@ def main(args: argparse.Namespace):
     if not omni.repo.ci.is_windows():
         extra_flags.append("--no-docker")
 
-    build_cmd = ["${root}/repo${shell_ext}", "build", "-x"] + extra_flags
+    build_cmd = [_REPO, "build", "-x"] + extra_flags
 
     # Full rebuild config
     omni.repo.ci.launch(build_cmd)
 
+    repo_config = omni.repo.ci.get_repo_config()
+
+    # Steps that only need the build output, grouped by the directory they write to. Steps in a group always run in
+    # order, only separate groups may run alongside each other.
+    post_build_steps: Dict[str, List[Callable[[], None]]] = {}
+
     if build_config == "release":
+        release_steps = []
         # Extensions verification for publishing (if publishing enabled)
-        if omni.repo.ci.get_repo_config().get("repo_publish_exts", {}).get("enabled", True):
-            omni.repo.ci.launch(["${root}/repo${shell_ext}", "publish_exts", "--verify"])
+        if repo_config.get("repo_publish_exts", {}).get("enabled", True):
+            release_steps.append(verify_publish_exts)
 
         # Tool to promote extensions to the public registry pipeline, if enabled (for apps)
-        if omni.repo.ci.get_repo_config().get("repo_deploy_exts", {}).get("enabled", False):
-            omni.repo.ci.launch(["${root}/repo${shell_ext}", "deploy_exts"])
+        if repo_config.get("repo_deploy_exts", {}).get("enabled", False):
+            release_steps.append(functools.partial(omni.repo.ci.launch, [_REPO, "deploy_exts"]))
+
+        if release_steps:
+            post_build_steps.setdefault("_build/packages", []).extend(release_steps)
 
     # Use repo_docs.enabled as indicator for whether to build docs
-    repo_docs_enabled = omni.repo.ci.get_repo_config().get("repo_docs", {}).get("enabled", True)
+    repo_docs_enabled = repo_config.get("repo_docs", {}).get("enabled", True)
     # repo_docs_enabled = repo_docs_enabled and omni.repo.ci.is_windows()
 
     # Docs
     if repo_docs_enabled:
-        omni.repo.ci.launch(["${root}/repo${shell_ext}", "docs", "--config", build_config, "--warn-as-error=0"])
-        # omni.repo.ci.launch(["${root}/repo${shell_ext}", "docs", "--config", build_config])
+        docs_cmd = [_REPO, "docs", "--config", build_config, "--warn-as-error=0"]
+        # docs_cmd = [_REPO, "docs", "--config", build_config]
+        post_build_steps.setdefault("_build/docs", []).append(functools.partial(omni.repo.ci.launch, docs_cmd))
+
+    if options.serial or len(post_build_steps) < 2:
+        for steps in post_build_steps.values():
+            run_in_order(steps)
+    else:
+        # The steps are separate processes, threads are only needed to wait on them
+        with ThreadPoolExecutor(max_workers=len(post_build_steps)) as executor:
+            futures = [executor.submit(run_in_order, steps) for steps in post_build_steps.values()]
+        # Re-raise the first failure once every step has finished
+        for future in futures:
+            future.result()
 
     # publish artifacts to teamcity
     print("##teamcity[publishArtifacts '_build/packages']")
@@ -5,10 +5,13 @@ from typing import Callable, Dict
 
 import omni.repo.ci
 
+# repo_ci expands the tokens when launching
+_REPO = "${root}/repo${shell_ext}"
+
 
 def main(args: argparse.Namespace):
     build_config_arg = ["-c", args.build_config]
-    test_cmd = ["${root}/repo${shell_ext}", "test"] + build_config_arg + args.extra_args
-    print(test_cmd)
+    test_cmd = [_REPO, "test"] + build_config_arg + args.extra_args
+    print(" ".join(test_cmd))
     # Run test
     omni.repo.ci.launch(test_cmd)